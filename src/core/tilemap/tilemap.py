@@ -2,7 +2,9 @@
 VGTileMap class for managing tilemaps with chunk support.
 """
 
-from typing import Tuple, List, Optional, Dict
+from typing import Tuple, List, Optional, Dict, Sequence, Union
+
+import numpy as np
 
 try:
     import pygame
@@ -24,11 +26,18 @@ class TileMapChunk:
         chunk_x: X coordinate of the chunk in chunk units.
         chunk_y: Y coordinate of the chunk in chunk units.
         chunk_size: Size of the chunk (width and height in tiles).
-        data: 2D list of MapCell objects for this chunk.
+        data: ``(chunk_size, chunk_size)`` array of tile IDs, ``-1`` where empty.
+        tileset_ids: ``(chunk_size, chunk_size)`` array of tileset IDs.
         dirty: Whether the chunk surface needs to be re-rendered.
     """
 
-    def __init__(self, chunk_x: int, chunk_y: int, chunk_size: int) -> None:
+    def __init__(
+        self,
+        chunk_x: int,
+        chunk_y: int,
+        chunk_size: int,
+        dtype: 'np.typing.DTypeLike' = np.int32
+    ) -> None:
         """
         Initialize a tilemap chunk.
 
@@ -36,20 +45,24 @@ class TileMapChunk:
             chunk_x: X coordinate of the chunk in chunk units.
             chunk_y: Y coordinate of the chunk in chunk units.
             chunk_size: Size of the chunk (width and height in tiles).
+            dtype: Signed integer dtype for tile and tileset IDs (default: int32).
         """
         self.chunk_x = chunk_x
         self.chunk_y = chunk_y
         self.chunk_size = chunk_size
-        self.data: List[List[MapCell]] = [
-            [MapCell() for _ in range(chunk_size)] for _ in range(chunk_size)
-        ]
+        self.data: np.ndarray = np.full((chunk_size, chunk_size), -1, dtype=dtype)
+        self.tileset_ids: np.ndarray = np.zeros((chunk_size, chunk_size), dtype=dtype)
         self.dirty: bool = True
         self._surface: Optional['pygame.Surface'] = None
+        self._scaled_surface: Optional['pygame.Surface'] = None
+        self._scaled_size: Tuple[int, int] = (0, 0)
 
     def get_tile(self, local_x: int, local_y: int) -> Optional[MapCell]:
         """
         Get tile at local position within the chunk.
 
+        The returned MapCell is a snapshot; use set_tile() to modify the chunk.
+
         Args:
             local_x: X coordinate within chunk (0 to chunk_size-1).
             local_y: Y coordinate within chunk (0 to chunk_size-1).
@@ -58,7 +71,10 @@ class TileMapChunk:
             MapCell object or None if out of bounds.
         """
         if 0 <= local_x < self.chunk_size and 0 <= local_y < self.chunk_size:
-            return self.data[local_y][local_x]
+            tile_id = int(self.data[local_y, local_x])
+            if tile_id < 0:
+                return MapCell()
+            return MapCell(int(self.tileset_ids[local_y, local_x]), tile_id)
         return None
 
     def set_tile(self, local_x: int, local_y: int, tileset_id: int, tile_id: int) -> None:
@@ -72,12 +88,11 @@ class TileMapChunk:
             tile_id: The tile ID.
         """
         if 0 <= local_x < self.chunk_size and 0 <= local_y < self.chunk_size:
-            if tile_id < 0:
-                self.data[local_y][local_x].clear()
-            else:
-                self.data[local_y][local_x].set(tileset_id, tile_id)
+            self.data[local_y, local_x] = max(tile_id, -1)
+            self.tileset_ids[local_y, local_x] = tileset_id
             self.dirty = True
             self._surface = None
+            self._scaled_surface = None
 
     def render_surface(self, tileset: TileSet, tile_w: int, tile_h: int) -> Optional['pygame.Surface']:
         """
@@ -98,29 +113,105 @@ class TileMapChunk:
             return self._surface
 
         size_px = self.chunk_size * tile_w, self.chunk_size * tile_h
+
+        surf = self._render_flat_colors(tileset, tile_w, tile_h, size_px)
+        if surf is not None:
+            self._surface = surf
+            self._scaled_surface = None
+            self.dirty = False
+            return surf
+
         surf = pygame.Surface(size_px, pygame.SRCALPHA)
         surf.fill((0, 0, 0, 0))
 
-        for ly in range(self.chunk_size):
-            row = self.data[ly]
-            for lx in range(self.chunk_size):
-                cell = row[lx]
-                if not cell.is_empty:
-                    tile_surf = tileset.get_tile_surface(cell.tile_id)
-                    if tile_surf:
-                        surf.blit(tile_surf, (lx * tile_w, ly * tile_h))
+        # Gather every non-empty tile and submit them in one blits() call
+        get_tile_surface = tileset.get_tile_surface
+        ys, xs = np.nonzero(self.data >= 0)
+        blit_seq = []
+        for ly, lx, tile_id in zip(ys.tolist(), xs.tolist(), self.data[ys, xs].tolist()):
+            tile_surf = get_tile_surface(tile_id)
+            if tile_surf:
+                blit_seq.append((tile_surf, (lx * tile_w, ly * tile_h)))
+        if blit_seq:
+            surf.blits(blit_seq, doreturn=False)
+
+        # Match the display pixel format so per-frame blits take SDL's fast path
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert_alpha()
 
         self._surface = surf
+        self._scaled_surface = None
         self.dirty = False
         return surf
 
+    def _render_flat_colors(
+        self,
+        tileset: TileSet,
+        tile_w: int,
+        tile_h: int,
+        size_px: Tuple[int, int]
+    ) -> Optional['pygame.Surface']:
+        """
+        Composite a fully populated chunk of a flat-color tileset with a color lookup.
+
+        Each tile ID is mapped to its RGB color and expanded to tile size in
+        NumPy, then copied into an opaque surface with one ``blit_array`` call.
+
+        Returns:
+            The chunk surface, or None if the fast path does not apply (tileset
+            without flat colors, different tile size, empty cells or unknown IDs).
+        """
+        colors = tileset.flat_colors
+        if not colors or tileset.tile_size != (tile_w, tile_h):
+            return None
+        data = self.data
+        if data.min() < 0 or data.max() >= len(colors):
+            return None
+
+        lut = np.asarray(colors, dtype=np.uint8)                  # (n, 3)
+        pixels = lut[data].repeat(tile_h, axis=0).repeat(tile_w, axis=1)
+        surf = pygame.Surface(size_px)
+        pygame.surfarray.blit_array(surf, pixels.swapaxes(0, 1))  # surfarray is (x, y)
+
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert()
+        return surf
+
+    def render_scaled_surface(
+        self,
+        tileset: TileSet,
+        tile_w: int,
+        tile_h: int,
+        size: Tuple[int, int]
+    ) -> Optional['pygame.Surface']:
+        """
+        Get the pre-rendered chunk surface scaled to *size*. Returns cached surface
+        while the chunk is clean and the requested size does not change.
+
+        Args:
+            tileset: TileSet to use for rendering.
+            tile_w: Tile width in pixels.
+            tile_h: Tile height in pixels.
+            size: Destination size (width, height) in pixels.
+
+        Returns:
+            A pygame Surface scaled to *size*, or None if pygame is unavailable.
+        """
+        base_surf = self.render_surface(tileset, tile_w, tile_h)
+        if base_surf is None:
+            return None
+
+        if base_surf.get_size() == size:
+            return base_surf
+
+        if self._scaled_surface is None or self._scaled_size != size:
+            self._scaled_surface = pygame.transform.scale(base_surf, size)
+            self._scaled_size = size
+        return self._scaled_surface
+
     def is_empty(self) -> bool:
         """Check if all cells in the chunk are empty."""
-        for row in self.data:
-            for cell in row:
-                if not cell.is_empty:
-                    return False
-        return True
+        return not (self.data >= 0).any()
 
     def __repr__(self) -> str:
         return f"TileMapChunk(pos=({self.chunk_x}, {self.chunk_y}), size={self.chunk_size})"
@@ -134,10 +225,17 @@ class TileMapLayer:
         width: Width of the layer in tiles.
         height: Height of the layer in tiles.
         chunk_size: Size of each chunk in tiles (default: 16).
+        dtype: Signed integer dtype of the chunk arrays.
         chunks: Dictionary of chunks, keyed by (chunk_x, chunk_y).
     """
 
-    def __init__(self, width: int, height: int, chunk_size: int = 16) -> None:
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        chunk_size: int = 16,
+        dtype: 'np.typing.DTypeLike' = np.int32
+    ) -> None:
         """
         Initialize a tilemap layer with chunk support.
 
@@ -145,10 +243,20 @@ class TileMapLayer:
             width: Width of the layer in tiles.
             height: Height of the layer in tiles.
             chunk_size: Size of each chunk in tiles (default: 16).
+            dtype: Signed integer dtype for tile and tileset IDs (default: int32).
+
+        Raises:
+            ValueError: If *dtype* is not a signed integer type (-1 marks empty cells).
         """
         self.width: int = width
         self.height: int = height
         self.chunk_size: int = chunk_size
+        self.dtype: np.dtype = np.dtype(dtype)
+        if self.dtype.kind != 'i':
+            raise ValueError(f"dtype must be a signed integer type, got {self.dtype}")
+        info = np.iinfo(self.dtype)
+        self._min_id: int = int(info.min)
+        self._max_id: int = int(info.max)
         self.chunks: Dict[Tuple[int, int], TileMapChunk] = {}
 
     def _get_chunk_coords(self, x: int, y: int) -> Tuple[int, int, int, int]:
@@ -181,7 +289,7 @@ class TileMapLayer:
         """
         chunk_key = (chunk_x, chunk_y)
         if chunk_key not in self.chunks:
-            self.chunks[chunk_key] = TileMapChunk(chunk_x, chunk_y, self.chunk_size)
+            self.chunks[chunk_key] = TileMapChunk(chunk_x, chunk_y, self.chunk_size, self.dtype)
         return self.chunks[chunk_key]
 
     def get_tile(self, x: int, y: int) -> Optional[MapCell]:
@@ -216,9 +324,14 @@ class TileMapLayer:
             y: Y coordinate in tile units.
             tileset_id: The tileset ID.
             tile_id: The tile ID.
+
+        Raises:
+            ValueError: If an ID does not fit the layer's dtype.
         """
         if not (0 <= x < self.width and 0 <= y < self.height):
             return
+        if tile_id > self._max_id or not self._min_id <= tileset_id <= self._max_id:
+            raise ValueError(f"Tile/tileset ID out of range for {self.dtype}")
 
         chunk_x, chunk_y, local_x, local_y = self._get_chunk_coords(x, y)
         chunk = self._get_or_create_chunk(chunk_x, chunk_y)
@@ -230,6 +343,108 @@ class TileMapLayer:
             if chunk_key in self.chunks:
                 del self.chunks[chunk_key]
 
+    def set_tiles(
+        self,
+        tile_ids: Union[np.ndarray, Sequence[Sequence[int]]],
+        tileset_id: int,
+        origin_x: int = 0,
+        origin_y: int = 0
+    ) -> None:
+        """
+        Set a rectangular block of tiles in one pass.
+
+        The block is copied into each overlapping chunk as one array slice and
+        each touched chunk is invalidated once, instead of paying the per-tile
+        bookkeeping of set_tile().
+
+        Args:
+            tile_ids: 2D array (or rows) of tile IDs, ``tile_ids[row][col]``;
+                      negative IDs clear the cell.
+            tileset_id: The tileset ID for every cell written.
+            origin_x: X coordinate (tiles) of the block's top-left corner.
+            origin_y: Y coordinate (tiles) of the block's top-left corner.
+
+        Raises:
+            ValueError: If an ID does not fit the layer's dtype.
+        """
+        block = np.asarray(tile_ids)
+        if block.ndim != 2:
+            return
+        if not self._min_id <= tileset_id <= self._max_id or (
+                block.size and not np.can_cast(block.dtype, self.dtype)
+                and int(block.max()) > self._max_id):
+            raise ValueError(f"Tile/tileset ID out of range for {self.dtype}")
+        if block.dtype.kind != 'u':
+            block = np.maximum(block, -1)  # any negative ID means "empty"
+        cs = self.chunk_size
+        block_h, block_w = block.shape
+
+        # Clip the block to the layer
+        x0 = max(0, origin_x)
+        y0 = max(0, origin_y)
+        x1 = min(self.width, origin_x + block_w)
+        y1 = min(self.height, origin_y + block_h)
+        if x0 >= x1 or y0 >= y1:
+            return
+
+        for chunk_y in range(y0 // cs, (y1 - 1) // cs + 1):
+            ty0 = max(y0, chunk_y * cs)
+            ty1 = min(y1, (chunk_y + 1) * cs)
+            for chunk_x in range(x0 // cs, (x1 - 1) // cs + 1):
+                tx0 = max(x0, chunk_x * cs)
+                tx1 = min(x1, (chunk_x + 1) * cs)
+
+                chunk = self._get_or_create_chunk(chunk_x, chunk_y)
+                dst = (slice(ty0 - chunk_y * cs, ty1 - chunk_y * cs),
+                       slice(tx0 - chunk_x * cs, tx1 - chunk_x * cs))
+                src = block[ty0 - origin_y:ty1 - origin_y, tx0 - origin_x:tx1 - origin_x]
+                chunk.data[dst] = src
+                chunk.tileset_ids[dst] = tileset_id
+
+                chunk.dirty = True
+                chunk._surface = None
+                chunk._scaled_surface = None
+                if chunk.is_empty():
+                    del self.chunks[(chunk_x, chunk_y)]
+
+    def neighbours(self, x: int, y: int, radius: int = 1) -> np.ndarray:
+        """
+        Get the tile IDs in the square of *radius* tiles around (x, y).
+
+        Args:
+            x: X coordinate in tile units.
+            y: Y coordinate in tile units.
+            radius: Half-size of the square (default: 1, i.e. 3x3).
+
+        Returns:
+            ``(2*radius+1, 2*radius+1)`` int32 array of tile IDs, ``-1`` for
+            empty or out-of-bounds cells.
+        """
+        size = 2 * radius + 1
+        out = np.full((size, size), -1, dtype=np.int32)
+        x0 = max(0, x - radius)
+        y0 = max(0, y - radius)
+        x1 = min(self.width, x + radius + 1)
+        y1 = min(self.height, y + radius + 1)
+        if x0 >= x1 or y0 >= y1:
+            return out
+
+        cs = self.chunk_size
+        for chunk_y in range(y0 // cs, (y1 - 1) // cs + 1):
+            ty0 = max(y0, chunk_y * cs)
+            ty1 = min(y1, (chunk_y + 1) * cs)
+            for chunk_x in range(x0 // cs, (x1 - 1) // cs + 1):
+                chunk = self.chunks.get((chunk_x, chunk_y))
+                if chunk is None:
+                    continue
+                tx0 = max(x0, chunk_x * cs)
+                tx1 = min(x1, (chunk_x + 1) * cs)
+                out[ty0 - (y - radius):ty1 - (y - radius),
+                    tx0 - (x - radius):tx1 - (x - radius)] = chunk.data[
+                    ty0 - chunk_y * cs:ty1 - chunk_y * cs,
+                    tx0 - chunk_x * cs:tx1 - chunk_x * cs]
+        return out
+
     def clear(self) -> None:
         """Clear all tiles in the layer by removing all chunks."""
         self.chunks.clear()
@@ -270,6 +485,7 @@ class TileMap:
         height: Height of the tilemap in tiles.
         tile_size: Size of each tile as (width, height) in pixels.
         chunk_size: Size of each chunk in tiles.
+        dtype: Signed integer dtype used to store tile and tileset IDs.
         layers: List of TileMapLayer objects.
         tilesets: Dictionary of TileSet objects indexed by tileset_id.
     """
@@ -280,7 +496,8 @@ class TileMap:
         height: int,
         tile_size: Tuple[int, int] = (32, 32),
         num_layers: int = 1,
-        chunk_size: int = 16
+        chunk_size: int = 16,
+        dtype: 'np.typing.DTypeLike' = np.int32
     ) -> None:
         """
         Initialize the tilemap with chunk support.
@@ -291,17 +508,21 @@ class TileMap:
             tile_size: Size of each tile as (width, height) in pixels (default: (32, 32)).
             num_layers: Number of layers (default: 1).
             chunk_size: Size of each chunk in tiles (default: 16).
+            dtype: Signed integer dtype for tile and tileset IDs (default: int32).
+                   Pass ``np.int16`` to halve chunk memory when every ID
+                   stays within -32768..32767.
         """
         self.width = width
         self.height = height
         self.tile_size = tile_size
         self.chunk_size = chunk_size
+        self.dtype = np.dtype(dtype)
         self.layers: List[TileMapLayer] = []
         self.tilesets: Dict[int, TileSet] = {}  # tileset_id -> TileSet
 
         # Create initial layers with chunk support
         for _ in range(num_layers):
-            self.layers.append(TileMapLayer(width, height, chunk_size))
+            self.layers.append(TileMapLayer(width, height, chunk_size, dtype))
 
     @property
     def tile_width(self) -> int:
@@ -350,6 +571,42 @@ class TileMap:
         if 0 <= layer < len(self.layers):
             self.layers[layer].set_tile(x, y, tileset_id, tile_id)
 
+    def set_tiles(
+        self,
+        tile_ids: Union[np.ndarray, Sequence[Sequence[int]]],
+        tileset_id: int = 0,
+        layer: int = 0,
+        origin: Tuple[int, int] = (0, 0)
+    ) -> None:
+        """
+        Set a rectangular block of tiles in one pass (see TileMapLayer.set_tiles).
+
+        Args:
+            tile_ids: 2D array (or rows) of tile IDs, ``tile_ids[row][col]``.
+            tileset_id: The tileset ID (default: 0).
+            layer: Layer index (default: 0).
+            origin: Top-left corner of the block in tile units (default: (0, 0)).
+        """
+        if 0 <= layer < len(self.layers):
+            self.layers[layer].set_tiles(tile_ids, tileset_id, origin[0], origin[1])
+
+    def neighbours(self, x: int, y: int, radius: int = 1, layer: int = 0) -> Optional[np.ndarray]:
+        """
+        Get the tile IDs around (x, y) on a layer (see TileMapLayer.neighbours).
+
+        Args:
+            x: X coordinate in tile units.
+            y: Y coordinate in tile units.
+            radius: Half-size of the square (default: 1).
+            layer: Layer index (default: 0).
+
+        Returns:
+            Array of tile IDs, or None if the layer is invalid.
+        """
+        if 0 <= layer < len(self.layers):
+            return self.layers[layer].neighbours(x, y, radius)
+        return None
+
     # layers
     def add_layer(self) -> int:
         """
@@ -358,7 +615,7 @@ class TileMap:
         Returns:
             Index of the new layer.
         """
-        self.layers.append(TileMapLayer(self.width, self.height, self.chunk_size))
+        self.layers.append(TileMapLayer(self.width, self.height, self.chunk_size, self.dtype))
         return len(self.layers) - 1
 
     def remove_layer(self, layer: int) -> bool:
@@ -628,14 +885,24 @@ class TileMap:
         chunk_world_h = cs * tile_h
         needs_scale = (zoom != 1.0)
 
-        # Determine visible chunk range from the camera
+        # Determine visible chunk range from the camera, clamped to the map
         min_x, min_y, max_x, max_y = camera.get_visible_area()
         start_cx = max(0, int(min_x // chunk_world_w))
         start_cy = max(0, int(min_y // chunk_world_h))
-        end_cx = int(max_x // chunk_world_w) + 1
-        end_cy = int(max_y // chunk_world_h) + 1
+        end_cx = min(int(max_x // chunk_world_w) + 1, (self.width - 1) // cs)
+        end_cy = min(int(max_y // chunk_world_h) + 1, (self.height - 1) // cs)
+        if start_cx > end_cx or start_cy > end_cy:
+            return
+
+        # Screen X bounds only depend on the column, so compute them once
+        col_bounds = []
+        for cx in range(start_cx, end_cx + 1):
+            sx_left = round(camera.world_to_screen(cx * chunk_world_w, 0)[0])
+            sx_right = round(camera.world_to_screen((cx + 1) * chunk_world_w, 0)[0])
+            col_bounds.append((cx, sx_left, sx_right - sx_left))
 
         lyr = self.layers[layer]
+        blit_seq = []  # (surface, dest) pairs submitted in a single blits() call
 
         for cy in range(start_cy, end_cy + 1):
             # Compute Y screen bounds for this row of chunks
@@ -645,29 +912,27 @@ class TileMap:
             if dest_h < 1:
                 continue
 
-            for cx in range(start_cx, end_cx + 1):
+            for cx, sx_left, dest_w in col_bounds:
+                if dest_w < 1:
+                    continue
                 chunk = lyr.chunks.get((cx, cy))
                 if chunk is None:
                     continue
 
-                # Pre-render the chunk at native resolution (cached if clean)
-                base_surf = chunk.render_surface(tileset, tile_w, tile_h)
-                if base_surf is None:
-                    continue
-
-                # Compute X screen bounds for this column of chunks
-                sx_left = round(camera.world_to_screen(cx * chunk_world_w, 0)[0])
-                sx_right = round(camera.world_to_screen((cx + 1) * chunk_world_w, 0)[0])
-                dest_w = sx_right - sx_left
-                if dest_w < 1:
-                    continue
-
+                # Pre-rendered chunk (and its scaled copy) are cached until dirty
                 if needs_scale:
-                    draw_surf = pygame.transform.scale(base_surf, (dest_w, dest_h))
+                    draw_surf = chunk.render_scaled_surface(
+                        tileset, tile_w, tile_h, (dest_w, dest_h)
+                    )
                 else:
-                    draw_surf = base_surf
+                    draw_surf = chunk.render_surface(tileset, tile_w, tile_h)
+                if draw_surf is None:
+                    continue
+
+                blit_seq.append((draw_surf, (sx_left, sy_top)))
 
-                surface.blit(draw_surf, (sx_left, sy_top))
+        if blit_seq:
+            surface.blits(blit_seq, doreturn=False)
 
     def __repr__(self) -> str:
         """String representation of the tilemap."""
@@ -33,6 +33,7 @@ class TileSet:
         rows: Number of rows in the tileset.
         image_path: Path to the tileset image file.
         surface: Pygame surface containing the tileset image.
+        flat_colors: RGB color of each tile for opaque flat-color tilesets, else None.
     """
 
     def __init__(self, tile_size: Tuple[int, int] = (32, 32)) -> None:
@@ -48,6 +49,8 @@ class TileSet:
         self.image_path: Optional[str] = None
         self.surface: Optional['pygame.Surface'] = None
         self._tile_cache: dict = {}  # tile_id -> pygame.Surface
+        self._tiles: List['pygame.Surface'] = []  # pre-sliced tiles indexed by tile_id
+        self.flat_colors: Optional[List[Tuple[int, int, int]]] = None
 
     @property
     def tile_width(self) -> int:
@@ -95,7 +98,21 @@ class TileSet:
             raise FileNotFoundError(f"Image file not found: {image_path}")
 
         # Load image with pygame
-        self.surface = pygame.image.load(str(path)).convert_alpha()
+        self.load_from_surface(pygame.image.load(str(path)).convert_alpha(), str(path.resolve()))
+
+    def load_from_surface(self, surface: 'pygame.Surface', image_path: Optional[str] = None) -> None:
+        """
+        Use an in-memory surface as the tileset image and calculate grid automatically.
+
+        Args:
+            surface: Tileset atlas surface.
+            image_path: Path the atlas was read from or saved to, if any.
+
+        Raises:
+            ValueError: If the surface dimensions are not divisible by tile size.
+        """
+        self.surface = surface
+        self.flat_colors = None
         self._tile_cache.clear()
         image_width, image_height = self.surface.get_size()
 
@@ -111,7 +128,8 @@ class TileSet:
 
         self.columns = image_width // self.tile_width
         self.rows = image_height // self.tile_height
-        self.image_path = str(path.resolve())
+        self.image_path = image_path
+        self.build_tile_surfaces()
 
     def get_tile_rect(self, tile_id: int) -> Optional[Tuple[int, int, int, int]]:
         """
@@ -134,6 +152,30 @@ class TileSet:
 
         return x, y, self.tile_width, self.tile_height
 
+    def build_tile_surfaces(self, atlas_surface: Optional['pygame.Surface'] = None) -> None:
+        """
+        Slice the atlas into one surface per tile, once, so draws never subsurface it.
+
+        Tiles are converted to the display format when a display exists.  Atlases
+        without per-pixel alpha use ``convert()``, which blits fastest.
+
+        Args:
+            atlas_surface: Atlas to slice. Defaults to ``self.surface``.
+        """
+        atlas = atlas_surface if atlas_surface is not None else self.surface
+        self._tiles = []
+        self._tile_cache.clear()
+        if atlas is None or not HAS_PYGAME:
+            return
+
+        has_display = pygame.display.get_surface() is not None
+        has_alpha = bool(atlas.get_flags() & pygame.SRCALPHA)
+        for tid in range(self.columns * self.rows):
+            tile_surf = atlas.subsurface(self.get_tile_rect(tid)).copy()
+            if has_display:
+                tile_surf = tile_surf.convert_alpha() if has_alpha else tile_surf.convert()
+            self._tiles.append(tile_surf)
+
     def get_tile_surface(self, tile_id: int) -> Optional['pygame.Surface']:
         """
         Get a pygame Surface for a specific tile. Results are cached.
@@ -144,6 +186,9 @@ class TileSet:
         Returns:
             Pygame Surface containing the tile or None if invalid.
         """
+        if 0 <= tile_id < len(self._tiles):
+            return self._tiles[tile_id]
+
         if tile_id in self._tile_cache:
             return self._tile_cache[tile_id]
 
@@ -173,6 +218,9 @@ class TileSet:
         """
         Generate a tileset image from a list of flat colors.
 
+        If every color is fully opaque the atlas and tiles are created without
+        per-pixel alpha; pass colors with alpha < 255 to get a transparent tileset.
+
         Args:
             colors: List of Color objects to create tiles from.
             tile_size: Size of each tile as (width, height) in pixels (default: (32, 32)).
@@ -213,8 +261,13 @@ class TileSet:
         image_width = columns * tile_width
         image_height = rows * tile_height
 
-        surface = pygame.Surface((image_width, image_height), pygame.SRCALPHA)
-        surface.fill((0, 0, 0, 0))  # Transparent background
+        # Per-pixel alpha only when some color needs it: opaque surfaces blit ~2x faster
+        opaque = all(color.a == 255 for color in colors)
+        if opaque:
+            surface = pygame.Surface((image_width, image_height))
+        else:
+            surface = pygame.Surface((image_width, image_height), pygame.SRCALPHA)
+            surface.fill((0, 0, 0, 0))  # Transparent background
 
         # Fill tiles with colors
         for idx, color in enumerate(colors):
@@ -224,9 +277,8 @@ class TileSet:
             x = col * tile_width
             y = row * tile_height
 
-            # Create a rect with the flat color
-            rgba = color.to_rgba()
-            pygame.draw.rect(surface, rgba, (x, y, tile_width, tile_height))
+            # Fill the tile rect with the flat color
+            surface.fill(color.to_rgba(), (x, y, tile_width, tile_height))
 
         # Save image
         if output_path is None:
@@ -237,9 +289,14 @@ class TileSet:
         path = Path(output_path)
         pygame.image.save(surface, str(path))
 
-        # Create and load tileset
+        # Create the tileset from the atlas already in memory (no PNG decode)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert() if opaque else surface.convert_alpha()
         tileset = TileSet(tile_size)
-        tileset.load_from_image(str(path))
+        tileset.load_from_surface(surface, str(path.resolve()))
+        if opaque:
+            # Lets TileMap composite chunks with a color lookup instead of blits
+            tileset.flat_colors = [color.to_rgba()[:3] for color in colors]
 
         return tileset
 
@@ -20,6 +20,7 @@ if str(src_dir) not in sys.path:
 import pygame
 
 from game.test_scenes import CharacterScene
+from src.ui import coalesce_motion
 
 
 # Constantes
@@ -57,7 +58,8 @@ class BaseGameApp:
 
     def handle_events(self):
         """Maneja eventos de teclado y ratón."""
-        for event in pygame.event.get():
+        # Fusiona las ráfagas de MOUSEMOTION: un evento por ráfaga, no por sondeo
+        for event in coalesce_motion(pygame.event.get()):
             if event.type == pygame.QUIT:
                 self.running = False
                 self.scene.running = False
@@ -17,6 +17,8 @@ class BaseScene:
     - draw(screen): Draw the scene
     """
 
+    __slots__ = ("name", "description", "active")
+
     def __init__(self, name: str, description: str = ""):
         """
         Initialize base scene.
@@ -15,6 +15,7 @@ from typing import Optional
 from src.core.tilemap.tilemap import TileMap
 from src.core.tilemap.tileset import TileSet
 from src.core.camera.camera import Camera
+from src.ui.fonts import get_font
 from .base_scene import BaseScene
 
 
@@ -40,6 +41,7 @@ class RandomTerrainScene(BaseScene):
 
         # Camera movement
         self.camera_speed = 500  # pixels per second
+        self._last_zoom: Optional[float] = None  # zoom used for the current camera bounds
 
         # Mouse interaction
         self.show_hover_info = True
@@ -72,10 +74,11 @@ class RandomTerrainScene(BaseScene):
         self.tilemap.tileset = self.tileset
 
         # Fill with random grayscale tiles (uniform distribution across 32 values)
+        randrange = random.randrange
+        set_tile = self.tilemap.set_tile
         for y in range(self.map_height):
             for x in range(self.map_width):
-                tile_id = random.randint(0, 31)
-                self.tilemap.set_tile(x, y, tile_id)
+                set_tile(x, y, randrange(32))
 
         print(f"Tilemap filled with random terrain tiles")
 
@@ -152,17 +155,19 @@ class RandomTerrainScene(BaseScene):
         elif keys[pygame.K_q]:
             self.camera.zoom /= zoom_speed ** dt
 
-        # Update camera bounds to account for current zoom level
-        visible_w = self.camera.width / self.camera.zoom
-        visible_h = self.camera.height / self.camera.zoom
-        world_w = self.map_width * self.tile_size
-        world_h = self.map_height * self.tile_size
-        self.camera.set_bounds(
-            min_x=0,
-            max_x=max(0.0, world_w - visible_w),
-            min_y=0,
-            max_y=max(0.0, world_h - visible_h),
-        )
+        # Update camera bounds to account for current zoom level (only when it changed)
+        if self.camera.zoom != self._last_zoom:
+            self._last_zoom = self.camera.zoom
+            visible_w = self.camera.width / self.camera.zoom
+            visible_h = self.camera.height / self.camera.zoom
+            world_w = self.map_width * self.tile_size
+            world_h = self.map_height * self.tile_size
+            self.camera.set_bounds(
+                min_x=0,
+                max_x=max(0.0, world_w - visible_w),
+                min_y=0,
+                max_y=max(0.0, world_h - visible_h),
+            )
 
         # Camera movement (speed adjusted by zoom so world-space movement is constant)
         dx = 0
@@ -195,8 +200,8 @@ class RandomTerrainScene(BaseScene):
 
     def _draw_ui(self, screen: pygame.Surface) -> None:
         """Draw UI elements."""
-        font = pygame.font.Font(None, 24)
-        small_font = pygame.font.Font(None, 20)
+        font = get_font(24)
+        small_font = get_font(20)
 
         # Camera position + zoom
         cam_text = f"Camera: ({int(self.camera.x)}, {int(self.camera.y)})  Zoom: {self.camera.zoom:.2f}x"
@@ -241,4 +246,5 @@ class RandomTerrainScene(BaseScene):
         self.tilemap = None
         self.tileset = None
         self.camera = None
+        self._last_zoom = None
 
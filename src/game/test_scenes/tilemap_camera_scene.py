@@ -33,6 +33,7 @@ class TilemapCameraScene(BaseScene):
 
         # Chunk tracking
         self.current_chunks = set()  # Set of (chunk_x, chunk_y) tuples being rendered
+        self._last_camera_chunk = None  # Camera chunk used for current_chunks
 
     def setup(self, screen_width: int, screen_height: int) -> None:
         """Setup large tilemap with chunk system and camera."""
@@ -87,6 +88,7 @@ class TilemapCameraScene(BaseScene):
     def cleanup(self) -> None:
         """Cleanup tileset file."""
         super().cleanup()
+        self._last_camera_chunk = None
 
         if self.tileset and self.tileset.image_path:
             tileset_path = Path(self.tileset.image_path)
@@ -125,6 +127,11 @@ class TilemapCameraScene(BaseScene):
         """
         chunk_x, chunk_y = self._get_camera_chunk_position()
 
+        # Nothing to do while the camera center stays inside the same chunk
+        if (chunk_x, chunk_y) == self._last_camera_chunk:
+            return
+        self._last_camera_chunk = (chunk_x, chunk_y)
+
         # Only render the chunk where the camera is
         new_chunks = set()
 
@@ -23,14 +23,23 @@ Tabs
 
 from __future__ import annotations
 
+import functools
 import json
-import tomllib
+import re
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
 
 import numpy as np
 import pygame
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+    HAS_ORJSON = False
+
 from src.core.tilemap.tilemap import TileMap
 from src.core.tilemap.tileset import TileSet
 from src.core.camera.camera import Camera
@@ -38,6 +47,7 @@ from src.ui import (
     UIManager, Label, Button, Checkbox, Dropdown,
     VBox, HBox, ScrollView, NumericInput, TabBar, TextInput, Panel,
 )
+from src.ui.fonts import get_font
 from core.character.base import BaseCharacter
 from core.character.shape import RectShape
 from core.color.color import Color
@@ -81,11 +91,46 @@ def _get_world_classes():
     return _VGWorld, _WorldParameterName, _WorldNoiseName, _WorldMatrixName
 
 
+_kernels_warmed = False
+
+
+def _warm_noise_kernels(noise_configs: Dict[str, Dict[str, Any]]) -> None:
+    """Compile/load the Numba noise kernels by sampling a tiny region per config."""
+    try:
+        NoiseGenerator2D = _get_NoiseGenerator2D()
+        for cfg in noise_configs.values():
+            NoiseGenerator2D.from_dict(cfg).generate_region([(0.0, 1.0, 2), (0.0, 1.0, 2)])
+    except Exception as e:
+        print(f"[WorldEditor] noise kernel warm-up failed: {e}")
+
+
+def _generate_noise_matrix(cfg: Dict[str, Any], rows: int, cols: int):
+    """Build a noise Matrix2D from a config dict (runs on the preview worker)."""
+    noise = _get_NoiseGenerator2D().from_dict(cfg)
+    return _get_Matrix2D().create_from_noise(noise, rows, cols)
+
+
 # ── Config paths ──────────────────────────────────────────────────────────────
 _ROOT = Path(__file__).parent.parent.parent.parent
 CONFIG_JSON  = _ROOT / "configs" / "config.json"
 CONFIG_TOML  = _ROOT / "configs" / "world_configs.toml"
 
+# orjson parses bytes several times faster; stdlib json is the fallback
+_json_loads = orjson.loads if HAS_ORJSON else json.loads
+
+# Parsed config.json, reused across scene entries while the file is unchanged
+_config_cache: Optional[tuple] = None   # (st_mtime_ns, data)
+
+
+def _load_config_json() -> Dict[str, Any]:
+    """Return the parsed config.json, re-reading it only when its mtime changes."""
+    global _config_cache
+    mtime = CONFIG_JSON.stat().st_mtime_ns
+    if _config_cache is None or _config_cache[0] != mtime:
+        _config_cache = (mtime, _json_loads(CONFIG_JSON.read_bytes()))
+    return _config_cache[1]
+
+
 # ── Visual constants ──────────────────────────────────────────────────────────
 PANEL_WIDTH    = 420
 TAB_H          = 36
@@ -98,6 +143,11 @@ TILE_SIZE       = 16
 CAMERA_SPEED    = 500
 ZOOM_SPEED      = 1.5
 _PANEL_MIN_W    = 180
+_CAMERA_KEYS    = (
+    pygame.K_LEFT, pygame.K_a, pygame.K_RIGHT, pygame.K_d,
+    pygame.K_UP, pygame.K_w, pygame.K_DOWN, pygame.K_s,
+    pygame.K_q, pygame.K_e,
+)
 _DIVIDER_W      = 4
 _DIVIDER_HIT_W  = 10
 BOTTOM_BAR_H    = 46   # fixed bottom bar height (holds "Previsualizar")
@@ -118,12 +168,38 @@ BTN_APL_BG    = (130, 90, 40)
 BTN_APL_HV    = (165, 115, 60)
 
 # ── Noise types ───────────────────────────────────────────────────────────────
-_NOISE_TYPE_NAMES  = ["PERLIN", "SIMPLEX", "SIMPLEX_SMOOTH", "CELLULAR", "VALUE_CUBIC", "VALUE"]
-_FRACTAL_TYPE_NAMES = ["NONE", "FBM", "RIDGED", "PING_PONG"]
+_NOISE_TYPE_NAMES  = ("PERLIN", "SIMPLEX", "SIMPLEX_SMOOTH", "CELLULAR", "VALUE_CUBIC", "VALUE")
+_FRACTAL_TYPE_NAMES = ("NONE", "FBM", "RIDGED", "PING_PONG")
+
+class _NoiseField(NamedTuple):
+    """Editable noise field; arg0..arg2 are (min, max, step) or (options, -, -)."""
+    label: str
+    key: str
+    wtype: str          # 'int' | 'float' | 'dropdown' | 'bool'
+    arg0: Any
+    arg1: Any
+    arg2: Any
+
+
+class _ParamSpec(NamedTuple):
+    """Display config for one WorldParameterName value."""
+    label: str
+    is_int: bool
+    mn: float
+    mx: float
+    step: float
+
+
+class _MatrixSpec(NamedTuple):
+    """Display config for one WorldMatrixName entry."""
+    label: str
+    noise_key: Optional[str]
+    binarize: bool
+
 
 # Editable noise fields: (label, config_key, widget_type, *args)
 # widget_type: 'int' | 'float' | 'dropdown' | 'bool'
-_NOISE_FIELD_CONFIG = [
+_NOISE_FIELD_CONFIG = tuple(_NoiseField(*f) for f in [
     ("Seed",            "seed",                       'int',      0,      2**31-1, 1),
     ("Noise Type",      "noise_type",                 'dropdown', _NOISE_TYPE_NAMES, None, None),
     ("Frequency",       "frequency",                  'float',    0.0001, 10.0,    0.001),
@@ -138,10 +214,10 @@ _NOISE_FIELD_CONFIG = [
     ("DW Amplitude",    "domain_warp_amplitude",      'float',    0.0,    500.0,   0.01),
     ("DW Frequency",    "domain_warp_frequency",      'float',    0.0001, 1.0,     0.01),
     ("DW Octaves",      "domain_warp_fractal_octaves",'int',      1,      16,      1),
-]
+])
 
 # WorldParameterName display config: (label, is_int, min, max, step)
-_PARAM_CONFIG: Dict[str, tuple] = {
+_PARAM_CONFIG: Dict[str, _ParamSpec] = {k: _ParamSpec(*v) for k, v in {
     "global_seed":              ("Global Seed",           True,  0,      2**31-1, 1),
     "world_size_x":             ("World Size X",          True,  1,      8192,    16),
     "world_size_y":             ("World Size Y",          True,  1,      8192,    16),
@@ -155,10 +231,10 @@ _PARAM_CONFIG: Dict[str, tuple] = {
     "volcanic_island_scale":    ("Volcanic Island Scale", False, 0.0,    1.0,     0.01),
     "island_threshold":         ("Island Threshold",      False, 0.0,    1.0,     0.01),
     "out_to_sea_factor":        ("Out to Sea Factor",     False, 0.0,    1.0,     0.01),
-}
+}.items()}
 
 # WorldMatrixName → (display label, noise key to generate from, binarize?)
-_MATRIX_CONFIG: Dict[str, tuple] = {
+_MATRIX_CONFIG: Dict[str, _MatrixSpec] = {k: _MatrixSpec(*v) for k, v in {
     "continental_elevation": ("Continental Elevation", "base_elevation",  False),
     "elevation":             ("Elevation",             "base_elevation",  False),
     "is_volcanic_land":      ("Is Volcanic Land",      "volcanic_noise",  True),
@@ -168,7 +244,20 @@ _MATRIX_CONFIG: Dict[str, tuple] = {
     "river_birth_positions": ("River Birth Positions", None,              False),
     "river_flow":            ("River Flow",            None,              False),
     "temperature":           ("Temperature",           None,              False),
-}
+}.items()}
+
+
+# ── Text rendering cache ─────────────────────────────────────────────────────
+
+def _render_text(text: str, size: int, color: tuple) -> pygame.Surface:
+    """Render *text* with the shared default font of *size*, once per key."""
+    return _render_with_font(text, get_font(size), color)
+
+
+@functools.lru_cache(maxsize=64)
+def _render_with_font(text: str, font: pygame.font.Font, color: tuple) -> pygame.Surface:
+    # Keyed on the font object, so clear_font_cache() also retires old renders
+    return font.render(text, True, color)
 
 
 # ── Helper widget factories ───────────────────────────────────────────────────
@@ -212,12 +301,11 @@ def _row(label_text: str, widget, content_w: int) -> HBox:
                 spacing=ROW_SPACING, align='center', auto_size=False)
     lbl = _lbl(label_text)
     lbl.width = ROW_LABEL_W
-    row.add_child(lbl)
-    row.add_child(widget)
+    row.add_children((lbl, widget))
     return row
 
 
-def _dropdown_small(options: List[str], index: int = 0, w: int = 150) -> Dropdown:
+def _dropdown_small(options: Sequence[str], index: int = 0, w: int = 150) -> Dropdown:
     return Dropdown(
         width=w, height=26, options=options, selected_index=index,
         font_size=15, bg_color=INPUT_BG, text_color=(255, 255, 255),
@@ -245,7 +333,7 @@ def _make_noise_widget(field_type: str, config_value, arg0, arg1, arg2):
         val = float(config_value) if config_value is not None else float(arg0)
         return _numeric(val, min_value=arg0, max_value=arg1, step=arg2, decimals=5)
     elif field_type == 'dropdown':
-        options = arg0  # arg0 is the list
+        options = arg0  # arg0 is the shared options tuple
         if isinstance(config_value, int):
             idx = max(0, min(config_value, len(options) - 1))
         elif isinstance(config_value, str):
@@ -279,6 +367,29 @@ def _read_noise_widget(widget, field_type: str):
     return 0
 
 
+# Texts float() accepts that a parameter field can hold (no inf/nan/underscores)
+_NUMBER_RE = re.compile(r'\s*[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?\s*')
+
+
+def _parse_param_inputs(controls: Dict[str, NumericInput]) -> Dict[str, Any]:
+    """
+    Parse every parameter field in one pass, without per-field exceptions.
+
+    Fields that are empty, half-typed or out of float range are left out, so
+    callers keep whatever value they had for them.
+    """
+    keys = [key for key, inp in controls.items() if _NUMBER_RE.fullmatch(inp.text)]
+    values = np.fromiter(
+        (float(controls[key].text) for key in keys), dtype=np.float64, count=len(keys)
+    )
+    finite = np.isfinite(values)
+    return {
+        key: int(val) if _PARAM_CONFIG[key].is_int else val
+        for key, val, ok in zip(keys, values.tolist(), finite.tolist())
+        if ok
+    }
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # Scene
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -286,6 +397,28 @@ def _read_noise_widget(widget, field_type: str):
 class WorldEditorScene(BaseScene):
     """Editor that exposes VGWorld parameters, noise preview, and matrix generation."""
 
+    # Fixed attribute set (see __init__): no per-instance __dict__
+    __slots__ = (
+        "running", "_active_noise_idx", "_active_param_cfg_idx", "_active_tab",
+        "_bottom_bar", "_cam_bounds_key", "_camera", "_char_panel", "_characters",
+        "_current_matrix", "_cursor", "_divider_key", "_divider_rect",
+        "_divider_start_panel_w", "_divider_start_x", "_dragging_divider",
+        "_hud_key", "_hud_surf", "_layout_dirty",
+        "_main_tab_bar", "_map_h", "_map_w", "_matrix_generated", "_matrix_status",
+        "_matrix_view_buttons", "_noise_configs", "_noise_controls", "_noise_dropdown",
+        "_noise_inner_scroll", "_noise_name_input", "_noise_names", "_noise_tab_vboxes",
+        "_panel_width", "_param_cfg_dropdown", "_param_cfg_name_input",
+        "_param_config_names", "_param_configs", "_param_controls", "_param_status",
+        "_pending_preview", "_pending_preview_info", "_preview_btn", "_preview_h",
+        "_preview_pool", "_preview_w", "_quant_buf", "_saved_ph",
+        "_saved_pw", "_screen_size", "_scroll_view", "_status_bar", "_tab_vboxes",
+        "_tilemap", "_tileset", "_ui", "_viewer_label", "_viewport_clip",
+        "_viewport_key", "_viewport_sub", "_wmn_by_key", "_world", "_wpn_by_key",
+    )
+
+    # Grayscale viewer tileset, built once and shared across scene instances/entries
+    _shared_tileset: Optional[TileSet] = None
+
     TABS = ["Parámetros", "Noises", "Matrices"]
     TAB_PARAMS   = 0
     TAB_NOISES   = 1
@@ -300,6 +433,8 @@ class WorldEditorScene(BaseScene):
 
         # World data
         self._world = None               # VGWorld instance (or None on failure)
+        self._wpn_by_key: Dict[str, Any] = {}   # param key → WorldParameterName
+        self._wmn_by_key: Dict[str, Any] = {}   # matrix key → WorldMatrixName
         self._noise_configs: Dict[str, Dict[str, Any]] = {}   # from config.json
         self._noise_names: List[str] = []
         self._param_configs: Dict[str, Dict[str, Any]] = {}   # from config.json ["parameters"]
@@ -336,9 +471,13 @@ class WorldEditorScene(BaseScene):
         self._preview_h: Optional[NumericInput] = None
         self._matrix_status: Dict[str, Label] = {}
         self._matrix_generated: Dict[str, bool] = {}
-        self._generated_matrices: Dict[str, Any] = {}   # mat_key → Matrix2D
         self._matrix_view_buttons: Dict[str, Button] = {}
 
+        # Background noise preview (worker thread + in-flight job)
+        self._preview_pool: Optional[ThreadPoolExecutor] = None
+        self._pending_preview: Optional[Future] = None
+        self._pending_preview_info: Optional[tuple] = None   # (name, pw, ph)
+
         # Fixed bottom bar
         self._bottom_bar = None
         self._preview_btn: Optional[Button] = None
@@ -347,7 +486,11 @@ class WorldEditorScene(BaseScene):
         self._tilemap: Optional[TileMap] = None
         self._tileset: Optional[TileSet] = None
         self._camera: Optional[Camera] = None
+        self._cam_bounds_key: Optional[tuple] = None   # inputs of the last set_bounds()
         self._current_matrix = None   # Matrix2D shown in viewer
+        self._hud_key: Optional[tuple] = None   # values behind the cached HUD line
+        self._hud_surf: Optional[pygame.Surface] = None
+        self._quant_buf: Optional[np.ndarray] = None   # float32 scratch for tile ids
         self._viewer_label: str = ""
         self._map_w: int = 0
         self._map_h: int = 0
@@ -364,27 +507,59 @@ class WorldEditorScene(BaseScene):
         self._dragging_divider: bool = False
         self._divider_start_x: int = 0
         self._divider_start_panel_w: int = 0
+        self._divider_key: Optional[tuple] = None   # (panel_width, sh) of _divider_rect
+        self._divider_rect: Optional[pygame.Rect] = None
+        self._cursor = None   # last system cursor passed to pygame.mouse.set_cursor()
+        self._viewport_key: Optional[tuple] = None   # (screen, sw, sh, panel_width)
+        self._viewport_clip: Optional[pygame.Rect] = None
+        self._viewport_sub: Optional[pygame.Surface] = None
+
+        # Layout changes (resize / divider drag) are applied once per frame
+        self._layout_dirty: bool = False
+        self._screen_size: tuple = (0, 0)   # (sw, sh), set on enter/resize
 
     # ── Lifecycle ─────────────────────────────────────────────────────────────
 
     def on_enter(self) -> None:
+        global _kernels_warmed
         self._load_data()
-        screen = pygame.display.get_surface()
-        sw, sh = screen.get_size()
-        self._build_ui(sw, sh)
+        # JIT the noise kernels off the UI thread so the first preview is not
+        # stalled. It is the first job on the preview worker, so it never runs
+        # alongside another noise evaluation and finishes before any preview.
+        if not _kernels_warmed and self._noise_configs:
+            _kernels_warmed = True
+            self._get_preview_pool().submit(_warm_noise_kernels, dict(self._noise_configs))
+        self._screen_size = pygame.display.get_surface().get_size()
+        self._build_ui(*self._screen_size)
 
     def on_exit(self) -> None:
+        if self._preview_pool is not None:
+            self._preview_pool.shutdown(wait=False, cancel_futures=True)
+            self._preview_pool = None
+        self._pending_preview = None
+        self._pending_preview_info = None
         self._tilemap = None
         self._tileset = None
         self._camera = None
+        self._cam_bounds_key = None
+        self._cursor = None
+        self._viewport_key = None
+        self._viewport_sub = None
         self._current_matrix = None
 
     def on_resize(self, sw: int, sh: int) -> None:
+        # Coalesce bursts of resize events; applied in update()
+        self._screen_size = (sw, sh)
+        self._layout_dirty = True
+
+    def _apply_layout(self, sw: int, sh: int) -> None:
+        """Resize/reposition the panel widgets for the current screen and panel width."""
         if self._ui:
             self._ui.resize(sw, sh)
         if self._main_tab_bar:
             self._main_tab_bar.width = self._panel_width
         if self._scroll_view:
+            self._scroll_view.width = self._panel_width
             self._scroll_view.height = sh - TAB_H - BOTTOM_BAR_H
         if self._bottom_bar:
             self._bottom_bar.y = sh - BOTTOM_BAR_H
@@ -402,18 +577,20 @@ class WorldEditorScene(BaseScene):
     def _load_data(self) -> None:
         # Noise + parameter configs from config.json
         try:
-            with open(CONFIG_JSON, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            self._noise_configs = data.get("noise", {})
+            data = _load_config_json()
+            # Shallow copies: the editor adds entries without touching the cache
+            self._noise_configs = dict(data.get("noise", {}))
             self._noise_names = list(self._noise_configs.keys())
-            self._param_configs = data.get("parameters", {})
+            self._param_configs = dict(data.get("parameters", {}))
             self._param_config_names = list(self._param_configs.keys())
         except Exception as e:
             print(f"[WorldEditor] config.json load error: {e}")
 
         # VGWorld
         try:
-            VGWorld, *_ = _get_world_classes()
+            VGWorld, WPN, _, WMN = _get_world_classes()
+            self._wpn_by_key = {k: WPN[k] for k in _PARAM_CONFIG if k in WPN.__members__}
+            self._wmn_by_key = dict(WMN.__members__)
             self._world = VGWorld()
             print("[WorldEditor] VGWorld loaded.")
         except Exception as e:
@@ -504,8 +681,11 @@ class WorldEditorScene(BaseScene):
             elif idx == self.TAB_MATRICES:
                 self._tab_vboxes[idx] = self._build_matrices_tab(cw)
 
-        self._scroll_view.clear_children()
         vbox = self._tab_vboxes[idx]
+        shown = self._scroll_view.children
+        if vbox is not None and shown and shown[0] is vbox:
+            return   # already showing this tab: keep layout and scroll position
+        self._scroll_view.clear_children()
         if vbox:
             self._scroll_view.add_child(vbox)
         # Reset scroll position
@@ -515,9 +695,8 @@ class WorldEditorScene(BaseScene):
 
     def _build_params_tab(self, cw: int) -> VBox:
         vbox = VBox(width=cw, spacing=7, align=VBox.ALIGN_LEFT, auto_size=True, padding=0)
-
-        vbox.add_child(_title("── Parámetros del Mundo ──"))
-        vbox.add_child(_spacer())
+        # Collected first and attached with a single layout pass at the end
+        children = [_title("── Parámetros del Mundo ──"), _spacer()]
 
         # Dropdown to select the active parameter config
         if self._param_config_names:
@@ -532,7 +711,7 @@ class WorldEditorScene(BaseScene):
             )
             self._param_cfg_dropdown.on_change(self._on_param_cfg_change)
             sel_row.add_child(self._param_cfg_dropdown)
-            vbox.add_child(sel_row)
+            children.append(sel_row)
 
             # Name row: editable config name + save button
             name_row = HBox(width=cw, height=30, spacing=6, align='center', auto_size=False)
@@ -545,32 +724,30 @@ class WorldEditorScene(BaseScene):
             btn_save = _btn("Guardar", BTN_APL_BG, BTN_APL_HV, w=80, h=26)
             btn_save.on_click(lambda _: self._save_param_config())
             name_row.add_child(btn_save)
-            vbox.add_child(name_row)
-            vbox.add_child(_spacer())
+            children += [name_row, _spacer()]
 
         # Load current values from the active JSON config (fallback: world, then TOML)
         raw_params = self._get_active_param_values()
 
         self._param_controls = {}
-        for key, (label, is_int, mn, mx, step) in _PARAM_CONFIG.items():
-            current = raw_params.get(key, mn)
-            inp = _numeric(current, min_value=mn, max_value=mx, step=step)
+        for key, spec in _PARAM_CONFIG.items():
+            current = raw_params.get(key, spec.mn)
+            inp = _numeric(current, min_value=spec.mn, max_value=spec.mx, step=spec.step)
             self._param_controls[key] = inp
-            vbox.add_child(_row(label, inp, cw))
+            children.append(_row(spec.label, inp, cw))
 
-        vbox.add_child(_spacer())
+        children.append(_spacer())
 
         # Apply button
         btn_row = HBox(width=cw, height=32, spacing=12, align='center', justify='center', auto_size=False)
         btn_apply = _btn("Aplicar Cambios", BTN_APL_BG, BTN_APL_HV, w=160)
         btn_apply.on_click(lambda _: self._apply_params())
         btn_row.add_child(btn_apply)
-        vbox.add_child(btn_row)
 
-        vbox.add_child(_spacer())
         self._param_status = Label(text="", font_size=15, color=(255, 200, 80), auto_size=True)
-        vbox.add_child(self._param_status)
+        children += [btn_row, _spacer(), self._param_status]
 
+        vbox.add_children(children)
         return vbox
 
     def _get_active_param_values(self) -> Dict[str, Any]:
@@ -580,14 +757,8 @@ class WorldEditorScene(BaseScene):
             return dict(self._param_configs.get(name, {}))
         # fallback: read from running world
         if self._world:
-            _, WPN, *_ = _get_world_classes()
-            result = {}
-            for key in _PARAM_CONFIG:
-                try:
-                    result[key] = self._world.parameters.get(WPN[key], 0)
-                except Exception:
-                    pass
-            return result
+            params = self._world.parameters
+            return {key: params.get(enum_key, 0) for key, enum_key in self._wpn_by_key.items()}
         return {}
 
     def _apply_params(self) -> None:
@@ -595,15 +766,13 @@ class WorldEditorScene(BaseScene):
             self._set_status("VGWorld no disponible")
             return
         try:
-            _, WPN, *_ = _get_world_classes()
-            for key, inp in self._param_controls.items():
-                try:
-                    enum_key = WPN[key]
-                    _, is_int, *_ = _PARAM_CONFIG[key]
-                    raw = inp.text
-                    self._world.parameters[enum_key] = int(float(raw)) if is_int else float(raw)
-                except Exception:
-                    pass
+            wpn_by_key = self._wpn_by_key
+            params = self._world.parameters
+            # Half-typed or empty fields keep the world's current value
+            for key, val in _parse_param_inputs(self._param_controls).items():
+                enum_key = wpn_by_key.get(key)
+                if enum_key is not None:
+                    params[enum_key] = val
             self._set_status("Parámetros aplicados al mundo.")
             if self._param_status:
                 self._param_status.text = "✓ Cambios aplicados"
@@ -617,9 +786,9 @@ class WorldEditorScene(BaseScene):
         # Update control values in-place (no rebuild needed)
         raw = self._get_active_param_values()
         for key, inp in self._param_controls.items():
-            _, is_int, mn, *_ = _PARAM_CONFIG[key]
-            val = raw.get(key, mn)
-            inp.text = str(int(val) if is_int else val)
+            spec = _PARAM_CONFIG[key]
+            val = raw.get(key, spec.mn)
+            inp.text = str(int(val) if spec.is_int else val)
 
     def _save_param_config(self) -> None:
         if self._param_cfg_name_input is None:
@@ -628,13 +797,7 @@ class WorldEditorScene(BaseScene):
         if not save_name:
             self._set_status("El nombre no puede estar vacío")
             return
-        cfg = {}
-        for key, inp in self._param_controls.items():
-            _, is_int, *_ = _PARAM_CONFIG[key]
-            try:
-                cfg[key] = int(float(inp.text)) if is_int else float(inp.text)
-            except ValueError:
-                pass
+        cfg = _parse_param_inputs(self._param_controls)
         try:
             with open(CONFIG_JSON, "r", encoding="utf-8") as f:
                 data = json.load(f)
@@ -747,6 +910,9 @@ class WorldEditorScene(BaseScene):
         name = self._noise_names[idx] if idx < len(self._noise_names) else ""
         if name and name not in self._noise_tab_vboxes:
             self._noise_tab_vboxes[name] = self._build_noise_field_vbox(name, inner_cw)
+        shown = self._noise_inner_scroll.children
+        if shown and shown[0] is self._noise_tab_vboxes.get(name):
+            return   # same noise already displayed
         self._noise_inner_scroll.clear_children()
         if name in self._noise_tab_vboxes:
             self._noise_inner_scroll.add_child(self._noise_tab_vboxes[name])
@@ -758,17 +924,19 @@ class WorldEditorScene(BaseScene):
         fields: Dict[str, tuple] = {}
 
         vbox = VBox(width=inner_cw, spacing=6, align=VBox.ALIGN_LEFT, auto_size=True, padding=0)
-        vbox.add_child(_lbl(name, font_size=18, color=TITLE_COLOR))
-        vbox.add_child(_spacer())
+        children = [_lbl(name, font_size=18, color=TITLE_COLOR), _spacer()]
 
-        for display_label, key, wtype, arg0, arg1, arg2 in _NOISE_FIELD_CONFIG:
-            config_value = cfg.get(key)
-            if config_value is None and wtype not in ('bool',):
+        for field in _NOISE_FIELD_CONFIG:
+            config_value = cfg.get(field.key)
+            if config_value is None and field.wtype != 'bool':
                 continue
-            widget = _make_noise_widget(wtype, config_value, arg0, arg1, arg2)
-            fields[key] = (widget, wtype)
-            vbox.add_child(_row(display_label, widget, inner_cw))
+            widget = _make_noise_widget(
+                field.wtype, config_value, field.arg0, field.arg1, field.arg2
+            )
+            fields[field.key] = (widget, field.wtype)
+            children.append(_row(field.label, widget, inner_cw))
 
+        vbox.add_children(children)
         self._noise_controls[name] = fields
         return vbox
 
@@ -786,11 +954,31 @@ class WorldEditorScene(BaseScene):
             self._set_status(f"Noise '{name}' no encontrado")
             return
         pw, ph = self._get_preview_size()
+        # Generate on a worker thread; update() picks up the result
+        if self._pending_preview is not None:
+            self._pending_preview.cancel()
+        self._pending_preview = self._get_preview_pool().submit(_generate_noise_matrix, cfg, ph, pw)
+        self._pending_preview_info = (name, pw, ph)
+        self._set_status(f"Generando: {name}  ({ph}×{pw})...")
+
+    def _get_preview_pool(self) -> ThreadPoolExecutor:
+        """The single noise worker; every noise kernel call in the scene runs on it."""
+        if self._preview_pool is None:
+            self._preview_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="noise")
+        return self._preview_pool
+
+    def _poll_preview(self) -> None:
+        """Show the background preview once its worker has finished."""
+        future = self._pending_preview
+        if future is None or not future.done():
+            return
+        name, pw, ph = self._pending_preview_info
+        self._pending_preview = None
+        self._pending_preview_info = None
+        if future.cancelled():
+            return
         try:
-            NoiseGenerator2D = _get_NoiseGenerator2D()
-            Matrix2D = _get_Matrix2D()
-            noise = NoiseGenerator2D.from_dict(cfg)
-            matrix = Matrix2D.create_from_noise(noise, ph, pw)
+            matrix = future.result()
             self._show_matrix(matrix, f"Noise: {name}", pw, ph)
             self._set_status(f"Previsualizado: {name}  ({ph}×{pw})")
         except Exception as e:
@@ -846,9 +1034,7 @@ class WorldEditorScene(BaseScene):
 
     def _build_matrices_tab(self, cw: int) -> VBox:
         vbox = VBox(width=cw, spacing=8, align=VBox.ALIGN_LEFT, auto_size=True, padding=0)
-
-        vbox.add_child(_title("── Matrices del Mundo ──"))
-        vbox.add_child(_spacer())
+        children = [_title("── Matrices del Mundo ──"), _spacer()]
 
         # Build the full matrix list from WorldMatrixName enum (auto-includes new entries).
         # _MATRIX_CONFIG provides optional metadata (noise key, binarize); unknown entries
@@ -876,24 +1062,27 @@ class WorldEditorScene(BaseScene):
             row.add_child(name_lbl)
 
             btn_ver = _btn("Ver", BTN_PRV_BG, BTN_PRV_HV, w=VER_W, h=26)
-            def _make_ver(mk=mat_key, ml=mat_label):
-                return lambda _: self._view_world_matrix(mk, ml)
-            btn_ver.on_click(_make_ver())
+            btn_ver._mat_key = mat_key
+            btn_ver._mat_label = mat_label
+            btn_ver.on_click(self._on_ver_click)
             row.add_child(btn_ver)
 
-            vbox.add_child(row)
+            children.append(row)
 
+        vbox.add_children(children)
         return vbox
 
+    def _on_ver_click(self, btn: Button) -> None:
+        """Shared "Ver" handler; the row's matrix is stored on the button."""
+        self._view_world_matrix(btn._mat_key, btn._mat_label)
+
     def _view_world_matrix(self, mat_key: str, mat_label: str) -> None:
         """Render a world matrix (from self._world.matrix) in the tilemap viewer."""
         if self._world is None:
             self._set_status("No hay mundo generado")
             return
         try:
-            _, _, _, WMN = _get_world_classes()
-            enum_member = WMN[mat_key]
-            matrix = self._world.matrix.get(enum_member)
+            matrix = self._world.matrix.get(self._wmn_by_key[mat_key])
             if matrix is None:
                 self._set_status(f"Matriz '{mat_label}' no disponible")
                 return
@@ -911,20 +1100,17 @@ class WorldEditorScene(BaseScene):
             return
         pw, ph = self._get_preview_size()
         try:
-            NoiseGenerator2D = _get_NoiseGenerator2D()
-            Matrix2D = _get_Matrix2D()
-            noise = NoiseGenerator2D.from_dict(cfg)
-            matrix = Matrix2D.create_from_noise(noise, ph, pw)
+            # Evaluated on the noise worker (and waited for) so the parallel
+            # kernels never run on two threads at once
+            matrix = self._get_preview_pool().submit(_generate_noise_matrix, cfg, ph, pw).result()
             if binarize and self._world:
-                _, WPN, *_ = _get_world_classes()
                 threshold = self._world.parameters.get(
-                    WPN["island_threshold"], 0.5
+                    self._wpn_by_key["island_threshold"], 0.5
                 )
                 matrix.binarize(threshold)
             elif binarize:
                 matrix.binarize(0.5)
             self._matrix_generated[mat_key] = True
-            self._generated_matrices[mat_key] = matrix
             btn_ver = self._matrix_view_buttons.get(mat_key)
             if btn_ver:
                 btn_ver.enabled = True
@@ -932,7 +1118,8 @@ class WorldEditorScene(BaseScene):
             if lbl:
                 lbl.text = "✓ Listo"
                 lbl.color = (100, 200, 100)
-            mat_label = _MATRIX_CONFIG.get(mat_key, (mat_key,))[0]
+            spec = _MATRIX_CONFIG.get(mat_key)
+            mat_label = spec.label if spec else mat_key
             self._show_matrix(matrix, f"Matriz: {mat_label}", pw, ph)
             self._set_status(f"Generada: {mat_label}  ({ph}×{pw})")
         except Exception as e:
@@ -959,33 +1146,33 @@ class WorldEditorScene(BaseScene):
         self._map_w = map_w
         self._map_h = map_h
 
-        # Tileset (shared, created once)
+        # Tileset (shared, created once per process)
         if self._tileset is None:
-            self._tileset = TileSet.generate_grayscale_tileset(
-                nsteps=GRAYSCALE_STEPS,
+            self._tileset = self._get_tileset()
+
+        # Tilemap: reuse it while the size matches, set_tiles() overwrites every cell
+        tm = self._tilemap
+        if tm is None or tm.width != map_w or tm.height != map_h:
+            self._tilemap = TileMap(
+                width=map_w, height=map_h,
                 tile_size=(TILE_SIZE, TILE_SIZE),
-                columns=GRAYSCALE_STEPS,
-                white_to_black=True,
+                dtype=np.int16,  # quantised uint8 tile IDs always fit
             )
-
-        # Tilemap
-        self._tilemap = TileMap(
-            width=map_w, height=map_h,
-            tile_size=(TILE_SIZE, TILE_SIZE),
-        )
-        self._tilemap.tileset = self._tileset
-
-        tile_ids = np.clip(
-            (matrix._data * (GRAYSCALE_STEPS - 1)).astype(int),
-            0, GRAYSCALE_STEPS - 1,
-        )
-        for r in range(map_h):
-            for c in range(map_w):
-                self._tilemap.set_tile(c, r, int(tile_ids[r, c]))
+            self._tilemap.tileset = self._tileset
+
+        # Quantise in a reused float32 scratch buffer, then one small uint8 cast
+        data = matrix._data[:map_h, :map_w]
+        buf = self._quant_buf
+        if buf is None or buf.shape != data.shape:
+            buf = self._quant_buf = np.empty(data.shape, dtype=np.float32)
+        np.multiply(data, GRAYSCALE_STEPS - 1, out=buf)
+        np.clip(buf, 0, GRAYSCALE_STEPS - 1, out=buf)
+        tile_ids = buf.astype(np.uint8)
+        # One bulk write instead of map_w * map_h set_tile() calls
+        self._tilemap.set_tiles(tile_ids)
 
         # Camera: create once, then preserve position/zoom
-        screen = pygame.display.get_surface()
-        sw, sh = screen.get_size()
+        sw, sh = self._screen_size
         if self._camera is None:
             world_w = map_w * TILE_SIZE
             world_h = map_h * TILE_SIZE
@@ -997,8 +1184,21 @@ class WorldEditorScene(BaseScene):
                 zoom=1.0, min_zoom=0.05, max_zoom=20.0,
             )
 
+    @classmethod
+    def _get_tileset(cls) -> TileSet:
+        """Return the grayscale viewer tileset, generating it on first use."""
+        if cls._shared_tileset is None:
+            cls._shared_tileset = TileSet.generate_grayscale_tileset(
+                nsteps=GRAYSCALE_STEPS,
+                tile_size=(TILE_SIZE, TILE_SIZE),
+                columns=GRAYSCALE_STEPS,
+                white_to_black=True,
+            )
+        return cls._shared_tileset
+
     def _set_status(self, text: str) -> None:
-        if self._status_bar:
+        # Label re-measures and re-renders on change only; skip identical writes early
+        if self._status_bar and self._status_bar.text != text:
             self._status_bar.text = text
 
     # ── Character panel ───────────────────────────────────────────────────────
@@ -1058,12 +1258,10 @@ class WorldEditorScene(BaseScene):
             return
 
         # Divider drag
-        screen = pygame.display.get_surface()
-        sw = screen.get_width()
-        divx = self._panel_width
+        sw = self._screen_size[0]
 
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            if abs(event.pos[0] - divx) <= _DIVIDER_HIT_W // 2:
+            if self._get_divider_rect().collidepoint(event.pos):
                 self._dragging_divider = True
                 self._divider_start_x = event.pos[0]
                 self._divider_start_panel_w = self._panel_width
@@ -1079,62 +1277,93 @@ class WorldEditorScene(BaseScene):
             if self._dragging_divider:
                 dx = event.pos[0] - self._divider_start_x
                 nw = max(_PANEL_MIN_W, min(sw - 200, self._divider_start_panel_w + dx))
-                self._panel_width = nw
-                if self._scroll_view:
-                    self._scroll_view.width = nw
-                if self._main_tab_bar:
-                    self._main_tab_bar.width = nw
+                if nw != self._panel_width:
+                    self._panel_width = nw
+                    self._layout_dirty = True
                 return
 
         if self._ui:
             self._ui.handle_event(event)
 
+    def _get_divider_rect(self) -> pygame.Rect:
+        """Divider hit area, rebuilt only when the panel width or screen height changes."""
+        key = (self._panel_width, self._screen_size[1])
+        if key != self._divider_key:
+            self._divider_key = key
+            self._divider_rect = pygame.Rect(
+                self._panel_width - _DIVIDER_HIT_W // 2, 0,
+                _DIVIDER_HIT_W // 2 * 2 + 1, self._screen_size[1],
+            )
+        return self._divider_rect
+
     # ── Update ────────────────────────────────────────────────────────────────
 
     def update(self, dt: float) -> None:
+        if self._layout_dirty:
+            self._layout_dirty = False
+            self._apply_layout(*self._screen_size)
+
+        self._poll_preview()
+
         if self._ui:
             self._ui.update(dt)
 
         for char in self._characters:
             char.update(dt)
 
-        # Cursor
-        mx = pygame.mouse.get_pos()[0]
-        if self._dragging_divider or abs(mx - self._panel_width) <= _DIVIDER_HIT_W // 2:
-            pygame.mouse.set_cursor(
-                getattr(pygame, "SYSTEM_CURSOR_SIZEWE", pygame.SYSTEM_CURSOR_ARROW)
-            )
+        # Cursor (only touch SDL when the shape actually changes)
+        if self._dragging_divider or self._get_divider_rect().collidepoint(pygame.mouse.get_pos()):
+            cursor = getattr(pygame, "SYSTEM_CURSOR_SIZEWE", pygame.SYSTEM_CURSOR_ARROW)
         else:
-            pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+            cursor = pygame.SYSTEM_CURSOR_ARROW
+        if cursor != self._cursor:
+            self._cursor = cursor
+            pygame.mouse.set_cursor(cursor)
 
         if not self._camera:
             return
 
-        keys = pygame.key.get_pressed()
+        # No focus or no camera key held: skip the per-key polling below
+        keys = None
+        if pygame.key.get_focused():
+            keys = pygame.key.get_pressed()
+            if not any(keys[k] for k in _CAMERA_KEYS):
+                keys = None
 
         # Zoom
-        if keys[pygame.K_e]:
-            self._camera.zoom *= ZOOM_SPEED ** dt
-        elif keys[pygame.K_q]:
-            self._camera.zoom /= ZOOM_SPEED ** dt
+        if keys is not None:
+            if keys[pygame.K_e]:
+                self._camera.zoom *= ZOOM_SPEED ** dt
+            elif keys[pygame.K_q]:
+                self._camera.zoom /= ZOOM_SPEED ** dt
 
         zoom = self._camera.zoom
-        world_w = self._map_w * TILE_SIZE
-        world_h = self._map_h * TILE_SIZE
-        viewport_px_w = self._camera.width - self._panel_width
-        viewport_px_h = self._camera.height
-        # Allow zooming out to see the full map with some extra margin
-        if world_w > 0 and world_h > 0:
-            self._camera.min_zoom = min(
-                viewport_px_w / world_w,
-                viewport_px_h / world_h,
-            ) * 0.25
-        vp_w = viewport_px_w / zoom
-        vp_h = viewport_px_h / zoom
-        self._camera.set_bounds(
-            min_x=0, max_x=max(0.0, world_w - vp_w),
-            min_y=0, max_y=max(0.0, world_h - vp_h),
+        # Zoom limits and bounds only change with zoom, map size or viewport size
+        bounds_key = (
+            zoom, self._map_w, self._map_h,
+            self._camera.width, self._camera.height, self._panel_width,
         )
+        if bounds_key != self._cam_bounds_key:
+            self._cam_bounds_key = bounds_key
+            world_w = self._map_w * TILE_SIZE
+            world_h = self._map_h * TILE_SIZE
+            viewport_px_w = self._camera.width - self._panel_width
+            viewport_px_h = self._camera.height
+            # Allow zooming out to see the full map with some extra margin
+            if world_w > 0 and world_h > 0:
+                self._camera.min_zoom = min(
+                    viewport_px_w / world_w,
+                    viewport_px_h / world_h,
+                ) * 0.25
+            vp_w = viewport_px_w / zoom
+            vp_h = viewport_px_h / zoom
+            self._camera.set_bounds(
+                min_x=0, max_x=max(0.0, world_w - vp_w),
+                min_y=0, max_y=max(0.0, world_h - vp_h),
+            )
+
+        if keys is None:
+            return
 
         speed = CAMERA_SPEED / zoom
         dx = dy = 0.0
@@ -1153,21 +1382,23 @@ class WorldEditorScene(BaseScene):
 
         # Tilemap viewer (right of panel)
         if self._tilemap and self._camera and self._tileset:
-            clip = pygame.Rect(self._panel_width, 0, sw - self._panel_width, sh)
+            # Viewport subsurface is reused until the screen or panel width changes
+            vp_key = (screen, sw, sh, self._panel_width)
+            if vp_key != self._viewport_key:
+                self._viewport_key = vp_key
+                self._viewport_clip = pygame.Rect(self._panel_width, 0, sw - self._panel_width, sh)
+                self._viewport_sub = screen.subsurface(self._viewport_clip)
             old_clip = screen.get_clip()
-            screen.set_clip(clip)
-            sub = screen.subsurface(clip)
-            self._tilemap.draw(sub, self._camera, self._tileset)
+            screen.set_clip(self._viewport_clip)
+            self._tilemap.draw(self._viewport_sub, self._camera, self._tileset)
             screen.set_clip(old_clip)
             self._draw_characters(screen)
             self._draw_hud(screen)
         else:
             # Placeholder when nothing is generated
             if sw > self._panel_width + 40:
-                font = pygame.font.Font(None, 22)
-                txt = font.render(
-                    "Previsualiza un noise o genera una matriz →",
-                    True, (70, 70, 95),
+                txt = _render_text(
+                    "Previsualiza un noise o genera una matriz →", 22, (70, 70, 95),
                 )
                 screen.blit(txt, (self._panel_width + 20, sh // 2 - 10))
 
@@ -1205,16 +1436,23 @@ class WorldEditorScene(BaseScene):
         screen.set_clip(old_clip)
 
     def _draw_hud(self, screen: pygame.Surface) -> None:
-        font = pygame.font.Font(None, 18)
+        font = get_font(18)
         cam = self._camera
-        info = (
-            f"{self._viewer_label}  |  "
-            f"Map {self._map_h}×{self._map_w}  "
-            f"Cam ({int(cam.x)},{int(cam.y)})  "
-            f"Zoom {cam.zoom:.2f}×"
+        # Re-render the info line only when one of its values changes
+        hud_key = (
+            self._viewer_label, self._map_h, self._map_w,
+            int(cam.x), int(cam.y), round(cam.zoom, 2),
         )
-        surf = font.render(info, True, (195, 195, 195))
-        screen.blit(surf, (self._panel_width + 8, 6))
+        if hud_key != self._hud_key:
+            self._hud_key = hud_key
+            info = (
+                f"{self._viewer_label}  |  "
+                f"Map {self._map_h}×{self._map_w}  "
+                f"Cam ({int(cam.x)},{int(cam.y)})  "
+                f"Zoom {cam.zoom:.2f}×"
+            )
+            self._hud_surf = font.render(info, True, (195, 195, 195))
+        screen.blit(self._hud_surf, (self._panel_width + 8, 6))
 
         # Cell value under cursor
         mx, my = pygame.mouse.get_pos()
@@ -1230,8 +1468,7 @@ class WorldEditorScene(BaseScene):
                 cell_surf = font.render(cell_text, True, (255, 220, 100))
                 screen.blit(cell_surf, (self._panel_width + 8, 24))
 
-        hint = "WASD/Flechas: mover | Q/E: zoom | ESC: salir"
-        h_surf = font.render(hint, True, (110, 110, 130))
+        h_surf = _render_text("WASD/Flechas: mover | Q/E: zoom | ESC: salir", 18, (110, 110, 130))
         screen.blit(h_surf, (self._panel_width + 8, screen.get_height() - 20))
 
     # ── Panel rebuild (after divider drag) ───────────────────────────────────
@@ -1248,16 +1485,16 @@ class WorldEditorScene(BaseScene):
         self._noise_name_input = None
         self._param_cfg_dropdown = None
         self._param_cfg_name_input = None
-        screen = pygame.display.get_surface()
-        sw, sh = screen.get_size()
         self._ui.clear()
-        self._build_ui(sw, sh)
+        self._build_ui(*self._screen_size)
 
 
 # ── Utility ───────────────────────────────────────────────────────────────────
 
+_PC_RE1 = re.compile(r'(.)([A-Z][a-z]+)')
+_PC_RE2 = re.compile(r'([a-z0-9])([A-Z])')
+
+
 def _pascal_to_snake(name: str) -> str:
     """Convert 'PascalCase' → 'snake_case'."""
-    import re
-    s1 = re.sub(r'(.)([A-Z][a-z]+)', r'\1_\2', name)
-    return re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+    return _PC_RE2.sub(r'\1_\2', _PC_RE1.sub(r'\1_\2', name)).lower()
@@ -45,7 +45,7 @@ Usage Example:
 """
 
 from .widget import Widget, WidgetState
-from .manager import UIManager
+from .manager import UIManager, coalesce_motion
 
 # Import widgets
 from .widgets import (
@@ -76,6 +76,7 @@ __all__ = [
     'Widget',
     'WidgetState',
     'UIManager',
+    'coalesce_motion',
 
     # Widgets
     'Label',
@@ -2,7 +2,7 @@
 Base Container widget for holding and organizing other widgets.
 """
 
-from typing import Optional, Tuple, Union, List
+from typing import Iterable, Optional, Tuple, Union, List
 
 import pygame
 
@@ -73,6 +73,7 @@ class Container(Widget):
         self._padding = padding
         self._auto_size = auto_size
         self._clip_children = clip_children
+        self._measured_size: Optional[Tuple[int, int]] = None
 
     @property
     def bg_color(self) -> Optional[Tuple]:
@@ -137,6 +138,19 @@ class Container(Widget):
         if self._auto_size:
             self._fit_to_children()
 
+    def add_children(self, children: Iterable[Widget]) -> None:
+        """
+        Add several child widgets and trigger layout once.
+
+        Args:
+            children: Widgets to add, in order.
+        """
+        for child in children:
+            super().add_child(child)
+        self._layout_children()
+        if self._auto_size:
+            self._fit_to_children()
+
     def remove_child(self, child: Widget) -> None:
         """
         Remove a child widget and trigger layout.
@@ -149,6 +163,51 @@ class Container(Widget):
         if self._auto_size:
             self._fit_to_children()
 
+    def layout(self) -> None:
+        """
+        Resolve the layout of this container and every nested container.
+
+        Runs two passes that visit each container at most twice, instead of
+        relaying out parents whenever a nested container resizes:
+        sizes are measured bottom-up (nested containers first, so auto-sized
+        children report their final size to their parent), then nested
+        containers whose size was changed by their parent (e.g. stretch
+        alignment) are arranged top-down against that final size.
+        """
+        self._measure()
+        self._arrange()
+
+    def _measure(self) -> Tuple[int, int]:
+        """
+        Lay out nested containers bottom-up, then this one.
+
+        Returns:
+            The (width, height) this container resolved to.
+        """
+        for child in self._children:
+            if isinstance(child, Container):
+                child._measure()
+
+        self._layout_children()
+        if self._auto_size:
+            self._fit_to_children()
+
+        self._measured_size = (self._rect.width, self._rect.height)
+        return self._measured_size
+
+    def _arrange(self) -> None:
+        """Re-place nested containers whose size was assigned by this one."""
+        for child in self._children:
+            if not isinstance(child, Container):
+                continue
+            size = (child._rect.width, child._rect.height)
+            if size != child._measured_size:
+                # The parent's size wins over the child's own auto-size
+                child._layout_children()
+                child._rect.width, child._rect.height = size
+                child._measured_size = size
+            child._arrange()
+
     def _layout_children(self) -> None:
         """
         Layout children. Override in subclasses for auto-layout.
@@ -177,6 +236,7 @@ class Container(Widget):
 
         self._rect.width = max_x + self._padding
         self._rect.height = max_y + self._padding
+        self._geometry_changed()
 
     def draw(self, surface: pygame.Surface) -> None:
         """Draw the container."""
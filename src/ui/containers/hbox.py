@@ -166,6 +166,7 @@ class HBox(Container):
 
             total_width = current_x - self._spacing + self._padding
             self._rect.width = max(self._padding * 2, total_width)
+            self._geometry_changed()
             return
 
         # Fixed width — apply justification along the main axis.
@@ -2,13 +2,18 @@
 ScrollView container for scrollable content.
 """
 
-from typing import Optional, Tuple
+from bisect import bisect_left
+from operator import attrgetter
+from typing import List, Optional, Set, Tuple
 
 import pygame
 
 from .container import Container
 from ..widget import Widget
 
+_get_y = attrgetter('y')
+_get_height = attrgetter('height')
+
 
 class ScrollView(Container):
     """
@@ -21,6 +26,7 @@ class ScrollView(Container):
     - Mouse wheel support
     - Draggable scrollbar thumb
     - Clipping of content to visible area
+    - Optional lazy mode that skips updating offscreen children
     - Correct hit-testing for children at any scroll position
 
     How it works:
@@ -61,6 +67,7 @@ class ScrollView(Container):
         border_width: int = 0,
         border_color: Optional[Tuple[int, int, int]] = None,
         padding: int = 0,
+        lazy: bool = False,
         parent: Optional[Widget] = None,
     ):
         """
@@ -85,6 +92,8 @@ class ScrollView(Container):
             border_width: Border width.
             border_color: Border color.
             padding: Internal padding.
+            lazy: If True, children outside the viewport are not updated
+                  (they are never drawn either way).
             parent: Parent widget.
         """
         # auto_size is always False for ScrollView (it has a fixed viewport size)
@@ -103,11 +112,35 @@ class ScrollView(Container):
         self._scrollbar_width = scrollbar_width
         self._scrollbar_color = scrollbar_color
         self._scrollbar_track_color = scrollbar_track_color
+        self._lazy = lazy
+        self._always_update: Set[Widget] = set()
 
         # Scrollbar drag state
         self._dragging_scrollbar = False
         self._drag_start_y = 0
         self._scroll_start_y = 0.0
+        self._drag_scroll_ratio = 0.0
+        self._drag_max_scroll = 0.0
+        self._pointer_inside = False  # pointer position at the last MOUSEMOTION
+
+        # Children bounds (max right, max bottom), memoized while a draw or
+        # event dispatch is in progress (see _content_bounds)
+        self._bounds_cache: Optional[Tuple[int, int]] = None
+        self._cache_bounds = False
+
+        # Sorted child tops and the tallest child height for culling (see
+        # _visible_children), with the (child count, content bounds) they were
+        # built for; _y_tops is None when the children are not stacked by y
+        self._y_tops: Optional[List[int]] = None
+        self._y_tallest = 0
+        self._y_index_key: Optional[Tuple[int, Tuple[int, int]]] = None
+
+        # Scratch rects reused every frame instead of allocating new ones.
+        # The geometry getters return them, so callers must treat them as
+        # read-only and short-lived.
+        self._viewport_rect_cache = pygame.Rect(0, 0, 0, 0)
+        self._track_rect_cache = pygame.Rect(0, 0, 0, 0)
+        self._thumb_rect_cache = pygame.Rect(0, 0, 0, 0)
 
     # -------------------------------------------------------------------------
     # Scroll offset — the core of the correct-position architecture
@@ -159,6 +192,20 @@ class ScrollView(Container):
             w -= self._scrollbar_width
         return max(0, w)
 
+    @property
+    def layout_width(self) -> int:
+        """
+        Width to lay content out against, assuming the vertical scrollbar is shown.
+
+        Sizing content for the scrollbar up front means it never has to be
+        laid out a second time once it grows past the viewport and the
+        scrollbar appears; short content merely leaves the gutter empty.
+        """
+        w = self.content_width
+        if self._show_scrollbar:
+            w -= self._scrollbar_width
+        return max(0, w)
+
     @property
     def viewport_height(self) -> int:
         """Visible area height (may be reduced by horizontal scrollbar)."""
@@ -172,20 +219,102 @@ class ScrollView(Container):
         """Total content width (explicit or calculated from children)."""
         if self._content_width > 0:
             return self._content_width
-        max_x = 0
-        for child in self._children:
-            max_x = max(max_x, child.x + child.width)
-        return max_x
+        return self._content_bounds()[0]
 
     @property
     def actual_content_height(self) -> int:
         """Total content height (explicit or calculated from children)."""
         if self._content_height > 0:
             return self._content_height
-        max_y = 0
-        for child in self._children:
-            max_y = max(max_y, child.y + child.height)
-        return max_y
+        return self._content_bounds()[1]
+
+    def _content_bounds(self) -> Tuple[int, int]:
+        """
+        Furthest right and bottom edges of the children, in one pass.
+
+        Inside draw() and handle_event() the result is memoized, since the
+        viewport, scrollbar and culling code ask for it many times per call.
+        Outside them it is always recomputed, so geometry changes made by
+        application code (e.g. a child VBox growing) are seen immediately.
+        The scan itself runs in C through Rect.unionall over the children's
+        own rects, so no per-child Python comparisons are needed.
+        """
+        bounds = self._bounds_cache
+        if bounds is None:
+            children = self._children
+            if children:
+                union = children[0]._rect.unionall([child._rect for child in children])
+                bounds = (max(0, union.right), max(0, union.bottom))
+            else:
+                bounds = (0, 0)
+            if self._cache_bounds:
+                self._bounds_cache = bounds
+        return bounds
+
+    def _visible_children(self) -> List[Widget]:
+        """
+        Children whose rect intersects the visible part of the content.
+
+        The test runs in content space, so no absolute_rect is built per child.
+        When children are stacked top to bottom (the usual list / VBox case)
+        the visible slice is found by binary search on their y positions.
+        Those are indexed once and reused until a child is added or removed,
+        the content bounds change (e.g. a child VBox grew), or
+        _invalidate_content_bounds() is called after moving children.
+        """
+        children = self._children
+        if not children:
+            return []
+        top = int(self._scroll_y)
+        bottom = top + self.viewport_height
+        left = int(self._scroll_x)
+        right = left + self.viewport_width
+
+        key = (len(children), self._content_bounds())
+        if key != self._y_index_key:
+            self._build_y_index()
+            self._y_index_key = key
+        tops = self._y_tops
+        if tops is not None:
+            tallest = self._y_tallest
+            candidates = children[bisect_left(tops, top - tallest):bisect_left(tops, bottom)]
+        else:
+            candidates = children
+
+        visible = []
+        append = visible.append
+        for child in candidates:
+            r = child._rect
+            if r.bottom > top and r.y < bottom and r.right > left and r.x < right:
+                append(child)
+        return visible
+
+    def _build_y_index(self) -> None:
+        """Record the children's tops if they are stacked top to bottom."""
+        # Per-child reads and the sortedness check run in C (map/attrgetter,
+        # and Timsort is a single linear pass over already-sorted input)
+        rects = [child._rect for child in self._children]
+        tops = list(map(_get_y, rects))
+        if tops == sorted(tops):
+            self._y_tops = tops
+            self._y_tallest = max(map(_get_height, rects))
+        else:
+            self._y_tops = None
+
+    def _invalidate_content_bounds(self) -> None:
+        """Drop the memoized children bounds (call after changing child geometry)."""
+        self._bounds_cache = None
+        self._y_index_key = None
+
+    def add_child(self, child: Widget) -> None:
+        """Add a child widget and drop the culling index."""
+        super().add_child(child)
+        self._y_index_key = None
+
+    def remove_child(self, child: Widget) -> None:
+        """Remove a child widget and drop the culling index."""
+        super().remove_child(child)
+        self._y_index_key = None
 
     def _needs_horizontal_scroll(self) -> bool:
         # Compare against content_width (not viewport_width) to avoid circular recursion.
@@ -227,18 +356,35 @@ class ScrollView(Container):
     # Scrollbar geometry
     # -------------------------------------------------------------------------
 
-    def _get_scrollbar_track_rect(self) -> pygame.Rect:
-        """Absolute rect of the vertical scrollbar track."""
-        abs_rect = self.absolute_rect
-        return pygame.Rect(
+    def _get_scrollbar_track_rect(self, abs_rect: Optional[pygame.Rect] = None) -> pygame.Rect:
+        """Absolute rect of the vertical scrollbar track (*abs_rect*: own absolute rect, if known).
+
+        Returns a scratch rect that is overwritten by the next call.
+        """
+        if abs_rect is None:
+            abs_rect = self.absolute_rect
+        track = self._track_rect_cache
+        track.update(
             abs_rect.right - self._padding - self._scrollbar_width,
             abs_rect.y + self._padding,
             self._scrollbar_width,
             self.content_height
         )
+        return track
+
+    def _get_thumb_height(self) -> int:
+        """Height of the vertical scrollbar thumb in pixels."""
+        track_h = self.content_height
+        return max(20, int(track_h * (self.viewport_height / self.actual_content_height)))
+
+    def _get_scrollbar_thumb_rect(
+        self,
+        track: Optional[pygame.Rect] = None
+    ) -> Optional[pygame.Rect]:
+        """Absolute rect of the vertical scrollbar thumb, or None (*track*: track rect, if known).
 
-    def _get_scrollbar_thumb_rect(self) -> Optional[pygame.Rect]:
-        """Absolute rect of the vertical scrollbar thumb, or None."""
+        Returns a scratch rect that is overwritten by the next call.
+        """
         if not self._needs_vertical_scroll():
             return None
 
@@ -246,13 +392,16 @@ class ScrollView(Container):
         viewport_h = self.viewport_height
         track_h = self.content_height
 
-        thumb_h = max(20, int(track_h * (viewport_h / content_h)))
+        thumb_h = self._get_thumb_height()
         max_scroll = content_h - viewport_h
         ratio = self._scroll_y / max_scroll if max_scroll > 0 else 0.0
         thumb_y = int(ratio * (track_h - thumb_h))
 
-        track = self._get_scrollbar_track_rect()
-        return pygame.Rect(track.x, track.y + thumb_y, self._scrollbar_width, thumb_h)
+        if track is None:
+            track = self._get_scrollbar_track_rect()
+        thumb = self._thumb_rect_cache
+        thumb.update(track.x, track.y + thumb_y, self._scrollbar_width, thumb_h)
+        return thumb
 
     # -------------------------------------------------------------------------
     # Event handling
@@ -262,14 +411,36 @@ class ScrollView(Container):
         if not self._state.visible or not self._state.enabled:
             return False
 
+        self._bounds_cache = None
+        self._cache_bounds = True
+        try:
+            return self._dispatch_event(event)
+        finally:
+            # Leave memoizing mode even if a child callback raised
+            self._cache_bounds = False
+            self._bounds_cache = None
+
+    def _dispatch_event(self, event: pygame.event.Event) -> bool:
+        """Event handling body of handle_event (children bounds are memoized)."""
+
         # --- Scrollbar drag ---
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            if self._show_scrollbar and self._needs_vertical_scroll():
+            # Geometry invariants read once for the whole branch
+            content_h = self.actual_content_height
+            track_h = self.content_height
+            if self._show_scrollbar and content_h > track_h:
                 thumb = self._get_scrollbar_thumb_rect()
                 if thumb and thumb.collidepoint(event.pos):
                     self._dragging_scrollbar = True
                     self._drag_start_y = event.pos[1]
                     self._scroll_start_y = self._scroll_y
+                    # Content pixels per track pixel, fixed for the whole drag
+                    scrollable_track = track_h - thumb.height
+                    scroll_range = content_h - self.viewport_height
+                    self._drag_scroll_ratio = (
+                        scroll_range / scrollable_track if scrollable_track > 0 else 0.0
+                    )
+                    self._drag_max_scroll = max(0.0, float(scroll_range))
                     return True
 
         elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
@@ -279,26 +450,38 @@ class ScrollView(Container):
 
         elif event.type == pygame.MOUSEMOTION:
             if self._dragging_scrollbar:
-                delta_y = event.pos[1] - self._drag_start_y
-                track_h = self.content_height
-                content_h = self.actual_content_height
-                viewport_h = self.viewport_height
-                thumb_h = max(20, int(track_h * (viewport_h / content_h)))
-                scrollable_track = track_h - thumb_h
-                if scrollable_track > 0:
-                    scroll_range = content_h - viewport_h
-                    self.scroll_y = self._scroll_start_y + delta_y * (scroll_range / scrollable_track)
+                if self._drag_scroll_ratio > 0:
+                    delta_y = event.pos[1] - self._drag_start_y
+                    # Clamp against the range fixed at drag start instead of
+                    # rescanning the children through the scroll_y setter;
+                    # draw re-clamps in case the content changes mid-drag.
+                    value = self._scroll_start_y + delta_y * self._drag_scroll_ratio
+                    self._scroll_y = max(0.0, min(value, self._drag_max_scroll))
                 return True
 
         # --- Guard: only dispatch click events that land within this viewport ---
         # This prevents nested ScrollViews from processing clicks that are
         # spatially outside their bounds (e.g. a click on a sibling widget
         # above the inner scroll should not be swallowed by the inner scroll).
-        # MOUSEWHEEL is exempt: the wheel check below uses contains_point itself.
         if event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
             if not self.contains_point(event.pos[0], event.pos[1]):
                 return False
 
+        # Motion far from the view is skipped too.  The first motion after the
+        # pointer leaves still reaches the children so they can clear their
+        # hover state, and motion with a button held is always dispatched so
+        # drags that started inside keep working.
+        elif event.type == pygame.MOUSEMOTION:
+            inside = self.contains_point(event.pos[0], event.pos[1])
+            was_inside = self._pointer_inside
+            self._pointer_inside = inside
+            if not inside and not was_inside and not any(getattr(event, "buttons", ())):
+                return False
+
+        elif event.type == pygame.MOUSEWHEEL:
+            if not self.contains_point(*pygame.mouse.get_pos()):
+                return False
+
         # --- Dispatch to children first ---
         # No viewport restriction here: children check their own contains_point.
         # Removing the restriction allows open dropdown lists (drawn outside the
@@ -308,12 +491,13 @@ class ScrollView(Container):
         for child in reversed(self._children):
             if child.handle_event(event):
                 return True
+        # Children may have resized themselves while handling the event
+        self._bounds_cache = None
 
-        # --- Mouse wheel (only if no child consumed it) ---
+        # --- Mouse wheel (only if no child consumed it; pointer checked above) ---
         if event.type == pygame.MOUSEWHEEL:
-            if self.contains_point(*pygame.mouse.get_pos()):
-                self.scroll_y = self._scroll_y - event.y * self._scroll_speed
-                return True
+            self.scroll_y = self._scroll_y - event.y * self._scroll_speed
+            return True
 
         # Handle container-level mouse events (hover tracking, etc.)
         # We do NOT call super().handle_event() to avoid a second child dispatch.
@@ -326,16 +510,70 @@ class ScrollView(Container):
         return False
 
     # -------------------------------------------------------------------------
-    # Drawing
+    # Update
     # -------------------------------------------------------------------------
 
+    @property
+    def lazy(self) -> bool:
+        """Whether children outside the viewport are skipped by update()."""
+        return self._lazy
+
+    @lazy.setter
+    def lazy(self, value: bool) -> None:
+        self._lazy = value
+
+    def set_always_update(self, child: Widget, value: bool = True) -> None:
+        """Keep updating *child* in lazy mode even while it is offscreen (e.g. animations)."""
+        if value:
+            self._always_update.add(child)
+        else:
+            self._always_update.discard(child)
+
+    def update(self, dt: float) -> None:
+        """Update children; in lazy mode only those inside the viewport."""
+        if not self._lazy:
+            super().update(dt)
+            return
+
+        self._bounds_cache = None
+        self._cache_bounds = True
+        try:
+            visible = self._visible_children()
+        finally:
+            self._cache_bounds = False
+            self._bounds_cache = None
+
+        for child in visible:
+            child.update(dt)
+        if self._always_update:
+            # Forget widgets that were removed from this view since
+            self._always_update = {c for c in self._always_update if c.parent is self}
+            for child in self._always_update:
+                if child not in visible:
+                    child.update(dt)
+
     def draw(self, surface: pygame.Surface) -> None:
         """Draw the scroll view with clipped children."""
         if not self.visible:
             return
 
+        self._bounds_cache = None
+        self._cache_bounds = True
+        try:
+            self._draw_contents(surface)
+        finally:
+            self._cache_bounds = False
+            self._bounds_cache = None
+
+    def _draw_contents(self, surface: pygame.Surface) -> None:
+        """Drawing body of draw (children bounds are memoized)."""
         abs_rect = self.absolute_rect
 
+        # Content may have shrunk since scroll_y was last written
+        max_scroll = max(0.0, self.actual_content_height - self.viewport_height)
+        if self._scroll_y > max_scroll:
+            self._scroll_y = max_scroll
+
         # Background
         if self._bg_color:
             if len(self._bg_color) == 4 and self._bg_color[3] < 255:
@@ -360,31 +598,36 @@ class ScrollView(Container):
         # Because _get_scroll_offset_for_children is overridden, every child's
         # absolute_rect already reflects the current scroll position — no
         # temporary position mutation needed.
-        viewport_rect = pygame.Rect(
-            abs_rect.x + self._padding,
-            abs_rect.y + self._padding,
-            self.viewport_width,
-            self.viewport_height
-        )
-        old_clip = surface.get_clip()
-        surface.set_clip(viewport_rect.clip(old_clip))
-
-        for child in self._children:
-            if child.visible:
-                # Fast cull: skip children entirely outside the viewport
-                if viewport_rect.colliderect(child.absolute_rect):
+        if self._children:
+            viewport_rect = self._viewport_rect_cache
+            viewport_rect.update(
+                abs_rect.x + self._padding,
+                abs_rect.y + self._padding,
+                self.viewport_width,
+                self.viewport_height
+            )
+            old_clip = surface.get_clip()
+            # A viewport covering the whole current clip needs no clipping
+            clip = not viewport_rect.contains(old_clip)
+            if clip:
+                surface.set_clip(viewport_rect.clip(old_clip))
+
+            # Cull: only children intersecting the viewport are drawn
+            for child in self._visible_children():
+                if child._state.visible:
                     child.draw(surface)
 
-        surface.set_clip(old_clip)
+            if clip:
+                surface.set_clip(old_clip)
 
         # Vertical scrollbar
         if self._show_scrollbar and self._needs_vertical_scroll():
-            track = self._get_scrollbar_track_rect()
+            track = self._get_scrollbar_track_rect(abs_rect)
             track_color = self._scrollbar_track_color or (40, 40, 40)
             pygame.draw.rect(surface, track_color, track,
                              border_radius=self._scrollbar_width // 2)
 
-            thumb = self._get_scrollbar_thumb_rect()
+            thumb = self._get_scrollbar_thumb_rect(track)
             if thumb:
                 thumb_color = self._scrollbar_color or (100, 100, 100)
                 if self._dragging_scrollbar:
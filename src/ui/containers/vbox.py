@@ -104,6 +104,13 @@ class VBox(Container):
         self._align = align
         self._justify = justify
 
+        # Incremental add_child bookkeeping (see _can_append): whether no child
+        # moved or resized since the last layout, how many children it placed,
+        # and the width _fit_to_children last set
+        self._layout_valid = False
+        self._laid_out_count = 0
+        self._fit_width: Optional[int] = None
+
     @property
     def spacing(self) -> int:
         """Get the spacing between children."""
@@ -149,23 +156,78 @@ class VBox(Container):
         else:  # LEFT
             child.x = self._padding
 
+    def add_child(self, child: Widget) -> None:
+        """
+        Add a child widget below the existing ones.
+
+        While the current layout is still valid only the new child is placed,
+        instead of re-laying out (and re-fitting) every child.
+
+        Args:
+            child: Widget to add.
+        """
+        if not self._can_append():
+            super().add_child(child)
+            return
+
+        prev = self._children[-1]
+        Widget.add_child(self, child)
+        child.y = prev._rect.bottom + self._spacing
+        self._apply_horizontal_align(child, self.content_width)
+        self._laid_out_count += 1
+
+        # Same result as _layout_children() + _fit_to_children() for a stacked column
+        rect = self._rect
+        rect.width = max(rect.width - self._padding, child._rect.right) + self._padding
+        rect.height = child._rect.bottom + self._padding
+        self._fit_width = rect.width
+        self._layout_valid = True  # placing the child cleared it
+        self._geometry_changed()
+
+    def _can_append(self) -> bool:
+        """Whether a new child can be placed without relaying out the others."""
+        return (
+            self._auto_size
+            and self._align in (self.ALIGN_LEFT, self.ALIGN_STRETCH)
+            and self._children
+            and self._layout_valid
+            and self._laid_out_count == len(self._children)
+            and self._fit_width == self._rect.width
+        )
+
+    def _child_geometry_changed(self, child: Widget) -> None:
+        # A child moved or resized: the next add_child must re-lay out
+        self._layout_valid = False
+
+    def _fit_to_children(self) -> None:
+        super()._fit_to_children()
+        self._fit_width = self._rect.width
+
     def _layout_children(self) -> None:
         """Arrange children vertically."""
+        self._layout_valid = False
+        self._laid_out_count = len(self._children)
         if not self._children:
             return
 
         content_width = self.content_width
+        padding = self._padding
+        spacing = self._spacing
+        align = self._apply_horizontal_align
 
         if self._auto_size:
             # Pack tightly from the top and auto-resize height.
-            current_y = self._padding
+            current_y = padding
             for child in self._children:
-                child.y = current_y
-                self._apply_horizontal_align(child, content_width)
-                current_y += child.height + self._spacing
+                rect = child._rect
+                rect.y = current_y
+                align(child, content_width)
+                current_y += rect.height + spacing
 
-            total_height = current_y - self._spacing + self._padding
-            self._rect.height = max(self._padding * 2, total_height)
+            total_height = current_y - spacing + padding
+            self._rect.height = max(padding * 2, total_height)
+            self._layout_valid = True  # align() above cleared it
+            self._geometry_changed()
             return
 
         # Fixed height — apply justification along the main axis.
@@ -175,24 +237,25 @@ class VBox(Container):
         remaining = content_height - total_child_height
 
         if self._justify == self.JUSTIFY_CENTER:
-            start_y = self._padding + remaining // 2
-            gap = self._spacing
+            start_y = padding + remaining // 2
+            gap = spacing
         elif self._justify == self.JUSTIFY_END:
-            start_y = self._padding + remaining - (n - 1) * self._spacing
-            gap = self._spacing
+            start_y = padding + remaining - (n - 1) * spacing
+            gap = spacing
         elif self._justify == self.JUSTIFY_SPACE_BETWEEN:
-            start_y = self._padding
+            start_y = padding
             gap = remaining // (n - 1) if n > 1 else 0
         elif self._justify == self.JUSTIFY_SPACE_AROUND:
             per_side = remaining // n if n > 0 else 0
-            start_y = self._padding + per_side // 2
+            start_y = padding + per_side // 2
             gap = per_side
         else:  # START
-            start_y = self._padding
-            gap = self._spacing
+            start_y = padding
+            gap = spacing
 
         current_y = start_y
         for child in self._children:
-            child.y = current_y
-            self._apply_horizontal_align(child, content_width)
-            current_y += child.height + gap
\ No newline at end of file
+            rect = child._rect
+            rect.y = current_y
+            align(child, content_width)
+            current_y += rect.height + gap
\ No newline at end of file
@@ -0,0 +1,53 @@
+"""
+Process-wide font cache shared by the UI widgets.
+
+Creating a ``pygame.font.Font`` parses the font file, so widgets ask this
+module for their fonts instead of building one per instance or per frame.
+"""
+
+import functools
+from typing import Optional, Set
+
+import pygame
+
+# System font families that failed to load once; they fail at every size,
+# so later lookups go straight to the default font.
+_failed_families: Set[str] = set()
+
+
+@functools.lru_cache(maxsize=128)
+def get_font(
+    size: int,
+    family: Optional[str] = None,
+    bold: bool = False,
+    italic: bool = False
+) -> pygame.font.Font:
+    """
+    Return a shared font, created once per (size, family, bold, italic).
+
+    Args:
+        size: Font size in pixels.
+        family: System font family name, or None for pygame's default font.
+        bold: Whether the font is bold.
+        italic: Whether the font is italic.
+
+    Returns:
+        The cached font. Do not change its style (bold, italic, ...) in place;
+        it is shared by every caller asking for the same key.
+    """
+    if family is not None and family not in _failed_families:
+        try:
+            return pygame.font.SysFont(family, size, bold=bold, italic=italic)
+        except (pygame.error, OSError):
+            # Unreadable system font file: use the default font instead.
+            _failed_families.add(family)
+    font = pygame.font.Font(None, size)
+    font.set_bold(bold)
+    font.set_italic(italic)
+    return font
+
+
+def clear_font_cache() -> None:
+    """Drop every cached font and failed family (e.g. after pygame.font.quit())."""
+    get_font.cache_clear()
+    _failed_families.clear()
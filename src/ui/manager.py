@@ -5,11 +5,59 @@ The UIManager acts as the root container for all UI widgets and integrates
 with the game loop.
 """
 
-from typing import Optional, List
+from typing import Dict, Iterable, Iterator, Optional, List, Set, Tuple
 
 import pygame
 
 from .widget import Widget
+from .containers.container import Container
+
+
+# Hit-test grid: cell size in pixels, and the number of top-level widgets
+# below which a plain linear scan is cheaper than maintaining the grid
+_GRID_CELL = 128
+_GRID_MIN_WIDGETS = 16
+
+
+def coalesce_motion(events: Iterable[pygame.event.Event]) -> Iterator[pygame.event.Event]:
+    """
+    Yield *events* with each run of consecutive MOUSEMOTION events merged.
+
+    A merged event carries the final ``pos`` and the summed ``rel`` of its
+    run, so a high-polling mouse costs one hover/drag pass per run instead
+    of one per SDL event.  Other events are yielded unchanged and in order.
+    Game loops that dispatch events themselves can use it as
+    ``for event in coalesce_motion(pygame.event.get()): ...``.
+
+    Args:
+        events: Events to coalesce, e.g. ``pygame.event.get()``.
+    """
+    pending: Optional[pygame.event.Event] = None
+    rel_x = rel_y = 0
+
+    for event in events:
+        if event.type == pygame.MOUSEMOTION:
+            pending = event
+            rel_x += event.rel[0]
+            rel_y += event.rel[1]
+            continue
+        if pending is not None:
+            yield _merged_motion(pending, rel_x, rel_y)
+            pending = None
+            rel_x = rel_y = 0
+        yield event
+
+    if pending is not None:
+        yield _merged_motion(pending, rel_x, rel_y)
+
+
+def _merged_motion(last: pygame.event.Event, rel_x: int, rel_y: int) -> pygame.event.Event:
+    """Return *last* with ``rel`` replaced by the accumulated motion."""
+    if last.rel == (rel_x, rel_y):
+        return last
+    attrs = dict(last.dict)
+    attrs['rel'] = (rel_x, rel_y)
+    return pygame.event.Event(pygame.MOUSEMOTION, attrs)
 
 
 class UIManager:
@@ -50,8 +98,16 @@ class UIManager:
         self._width = width
         self._height = height
         self._widgets: List[Widget] = []
+        self._widget_set: Set[Widget] = set()  # O(1) membership for add/remove
         self._focused_widget: Optional[Widget] = None
         self._hovered_widget: Optional[Widget] = None
+        self._layout_pending: List[Container] = []  # Roots to lay out on next update
+
+        # Coarse spatial index of top-level widgets for get_widget_at, rebuilt
+        # lazily after add/remove/clear/resize or invalidate_hit_grid().
+        # None while some top-level widget is nested (the grid can't be used)
+        self._grid: Optional[Dict[Tuple[int, int], List[Widget]]] = None
+        self._grid_valid = False
 
     @property
     def width(self) -> int:
@@ -75,8 +131,12 @@ class UIManager:
         Args:
             widget: Widget to add.
         """
-        if widget not in self._widgets:
+        if widget not in self._widget_set:
             self._widgets.append(widget)
+            self._widget_set.add(widget)
+            self._grid_valid = False
+            if isinstance(widget, Container):
+                self._layout_pending.append(widget)
 
     def remove(self, widget: Widget) -> None:
         """
@@ -85,8 +145,12 @@ class UIManager:
         Args:
             widget: Widget to remove.
         """
-        if widget in self._widgets:
+        if widget in self._widget_set:
             self._widgets.remove(widget)
+            self._widget_set.discard(widget)
+            self._grid_valid = False
+            if widget in self._layout_pending:
+                self._layout_pending.remove(widget)
             if self._focused_widget == widget:
                 self._focused_widget = None
             if self._hovered_widget == widget:
@@ -95,6 +159,9 @@ class UIManager:
     def clear(self) -> None:
         """Remove all widgets."""
         self._widgets.clear()
+        self._widget_set.clear()
+        self._layout_pending.clear()
+        self._grid_valid = False
         self._focused_widget = None
         self._hovered_widget = None
 
@@ -109,8 +176,14 @@ class UIManager:
         Returns:
             The widget at the position, or None.
         """
+        candidates = self._widgets
+        if len(candidates) >= _GRID_MIN_WIDGETS:
+            cell = self._grid_cell_at(x, y)
+            if cell is not None:
+                candidates = cell
+
         # Iterate in reverse to get topmost widget first
-        for widget in reversed(self._widgets):
+        for widget in reversed(candidates):
             if widget.visible and widget.contains_point(x, y):
                 # Check children
                 child = widget.get_child_at(x, y)
@@ -119,6 +192,52 @@ class UIManager:
                 return widget
         return None
 
+    def _grid_cell_at(self, x: int, y: int) -> Optional[List[Widget]]:
+        """
+        Top-level widgets whose rect overlaps the grid cell containing (x, y).
+
+        Returns None when the grid cannot answer (a top-level widget is
+        nested under another widget, or the point is off screen), in which
+        case the caller falls back to scanning every widget.
+        """
+        if not self._grid_valid:
+            self._build_grid()
+        grid = self._grid
+        if grid is None or not (0 <= x < self._width and 0 <= y < self._height):
+            return None
+        return grid.get((x // _GRID_CELL, y // _GRID_CELL), [])
+
+    def invalidate_hit_grid(self) -> None:
+        """
+        Rebuild the hit-test grid on the next lookup.
+
+        Adding, removing and resize() already do this; call it after moving
+        or resizing a top-level widget by hand (outside a resize()).
+        """
+        self._grid_valid = False
+
+    def _build_grid(self) -> None:
+        """Bin every top-level widget into the on-screen cells it overlaps."""
+        self._grid_valid = True
+        if any(w.parent is not None for w in self._widgets):
+            self._grid = None
+            return
+        grid: Dict[Tuple[int, int], List[Widget]] = {}
+        max_cx = (self._width - 1) // _GRID_CELL
+        max_cy = (self._height - 1) // _GRID_CELL
+        for widget in self._widgets:  # z-order is kept inside every cell
+            r = widget._rect
+            if r.width <= 0 or r.height <= 0:
+                continue
+            cx0 = max(0, r.x // _GRID_CELL)
+            cy0 = max(0, r.y // _GRID_CELL)
+            cx1 = min(max_cx, (r.right - 1) // _GRID_CELL)
+            cy1 = min(max_cy, (r.bottom - 1) // _GRID_CELL)
+            for cy in range(cy0, cy1 + 1):
+                for cx in range(cx0, cx1 + 1):
+                    grid.setdefault((cx, cy), []).append(widget)
+        self._grid = grid
+
     def handle_event(self, event: pygame.event.Event) -> bool:
         """
         Handle a pygame event and distribute to widgets.
@@ -164,6 +283,22 @@ class UIManager:
 
         return False
 
+    def handle_events(self, events: Iterable[pygame.event.Event]) -> None:
+        """
+        Handle a frame's worth of events, coalescing mouse motion.
+
+        Each run of consecutive MOUSEMOTION events is merged into one event
+        with the final ``pos`` and the summed ``rel``, so hover tracking and
+        drags do one tree walk per run instead of one per event.  Other events
+        are dispatched in order.  Prefer this over calling handle_event() for
+        every event when the events are not needed elsewhere.
+
+        Args:
+            events: Events to handle, e.g. ``pygame.event.get()``.
+        """
+        for event in coalesce_motion(events):
+            self.handle_event(event)
+
     # -------------------------------------------------------------------------
     # Tab navigation helpers
     # -------------------------------------------------------------------------
@@ -244,9 +379,27 @@ class UIManager:
         Args:
             dt: Delta time since last update in seconds.
         """
+        if self._layout_pending:
+            for widget in self._layout_pending:
+                widget.layout()
+            self._layout_pending.clear()
+
         for widget in self._widgets:
             widget.update(dt)
 
+    def layout(self) -> None:
+        """
+        Resolve the layout of every root container (see Container.layout).
+
+        Roots added since the last update are laid out automatically; call
+        this after changing a nested container's contents so its new size
+        propagates to its ancestors in one measure/arrange pass.
+        """
+        for widget in self._widgets:
+            if isinstance(widget, Container):
+                widget.layout()
+        self._layout_pending.clear()
+
     def draw(self, surface: pygame.Surface) -> None:
         """
         Draw all visible widgets, then draw overlay content on top.
@@ -258,14 +411,14 @@ class UIManager:
         Args:
             surface: Pygame surface to draw on.
         """
-        for widget in self._widgets:
-            if widget.visible:
-                widget.draw(surface)
+        # Visibility is filtered once and shared by both passes
+        visible = [widget for widget in self._widgets if widget.visible]
+        for widget in visible:
+            widget.draw(surface)
 
         # Overlay pass — drawn after everything else, no clip restrictions.
-        for widget in self._widgets:
-            if widget.visible:
-                widget.draw_overlay(surface)
+        for widget in visible:
+            widget.draw_overlay(surface)
 
     def resize(self, width: int, height: int) -> None:
         """
@@ -277,6 +430,7 @@ class UIManager:
         """
         self._width = width
         self._height = height
+        self._grid_valid = False
 
     def __len__(self) -> int:
         """Number of top-level widgets."""
@@ -12,7 +12,7 @@ from dataclasses import dataclass
 from typing import Optional, List, Callable
 
 
-@dataclass
+@dataclass(slots=True)
 class WidgetState:
     """
     Represents the current state of a widget.
@@ -51,6 +51,13 @@ class Widget(ABC):
     # so that UIManager's Tab navigation includes them.
     _focusable: bool = False
 
+    # Label, Panel and Dropdown (the widgets built by the hundred) add their own
+    # __slots__; every other widget still gets a __dict__ for its attributes.
+    __slots__ = (
+        "_rect", "_state", "_parent", "_children",
+        "_on_click", "_on_hover_enter", "_on_hover_exit", "_on_focus", "_on_blur",
+    )
+
     def __init__(
         self,
         x: int = 0,
@@ -97,6 +104,7 @@ class Widget(ABC):
     @x.setter
     def x(self, value: int) -> None:
         self._rect.x = value
+        self._geometry_changed()
 
     @property
     def y(self) -> int:
@@ -106,6 +114,7 @@ class Widget(ABC):
     @y.setter
     def y(self, value: int) -> None:
         self._rect.y = value
+        self._geometry_changed()
 
     @property
     def width(self) -> int:
@@ -115,6 +124,7 @@ class Widget(ABC):
     @width.setter
     def width(self, value: int) -> None:
         self._rect.width = max(0, value)
+        self._geometry_changed()
 
     @property
     def height(self) -> int:
@@ -124,6 +134,7 @@ class Widget(ABC):
     @height.setter
     def height(self, value: int) -> None:
         self._rect.height = max(0, value)
+        self._geometry_changed()
 
     @property
     def size(self) -> tuple[int, int]:
@@ -134,6 +145,7 @@ class Widget(ABC):
     def size(self, value: tuple[int, int]) -> None:
         self._rect.width = max(0, value[0])
         self._rect.height = max(0, value[1])
+        self._geometry_changed()
 
     @property
     def position(self) -> tuple[int, int]:
@@ -144,6 +156,21 @@ class Widget(ABC):
     def position(self, value: tuple[int, int]) -> None:
         self._rect.x = value[0]
         self._rect.y = value[1]
+        self._geometry_changed()
+
+    def _geometry_changed(self) -> None:
+        """
+        Tell the parent this widget moved or resized.
+
+        Called by the geometry setters and by widgets that resize their own
+        rect (auto-sized labels, fitted containers, ...).
+        """
+        parent = self._parent
+        if parent is not None:
+            parent._child_geometry_changed(self)
+
+    def _child_geometry_changed(self, child: 'Widget') -> None:
+        """Hook for parents that cache their children's layout; no-op here."""
 
     @property
     def rect(self) -> pygame.Rect:
@@ -6,6 +6,7 @@ from typing import Optional, Tuple
 
 import pygame
 
+from ..fonts import get_font
 from ..widget import Widget
 
 
@@ -120,9 +121,8 @@ class Button(Widget):
         return self._text_color or (255, 255, 255)
 
     def _get_font(self) -> pygame.font.Font:
-        """Get the pygame font object."""
-        size = self._font_size or 16
-        return pygame.font.Font(None, size)
+        """Get the pygame font object (shared through the UI font cache)."""
+        return get_font(self._font_size or 16)
 
     def _render_text(self) -> None:
         """Render the text to a surface, only when text or color has changed."""
@@ -6,6 +6,7 @@ from typing import Optional, Tuple, Callable
 
 import pygame
 
+from ..fonts import get_font
 from ..widget import Widget
 
 
@@ -132,9 +133,8 @@ class Checkbox(Widget):
         self.checked = not self._checked
 
     def _get_font(self) -> pygame.font.Font:
-        """Get the pygame font object."""
-        size = self._font_size or 16
-        return pygame.font.Font(None, size)
+        """Get the pygame font object (shared through the UI font cache)."""
+        return get_font(self._font_size or 16)
 
     def _update_size(self) -> None:
         """Update widget size based on text."""
@@ -146,6 +146,7 @@ class Checkbox(Widget):
         else:
             self._rect.width = self._box_size
             self._rect.height = self._box_size
+        self._geometry_changed()
 
     def _render_text(self) -> None:
         """Render the label text."""
@@ -5,13 +5,27 @@ Displays a button that, when clicked, shows a scrollable list of options.
 The user can pick one option which then becomes the current selection.
 """
 
-from typing import Optional, Tuple, List, Callable
+import functools
+from array import array
+from typing import Dict, Optional, Tuple, List, Callable
 
 import pygame
 
+from ..fonts import get_font
 from ..widget import Widget
 
 
+def _arrow_surface(char: str, size: int, color: Tuple[int, int, int]) -> pygame.Surface:
+    """Return an arrow glyph rendered once and shared by every dropdown."""
+    return _render_arrow(char, get_font(size), color)
+
+
+@functools.lru_cache(maxsize=32)
+def _render_arrow(char: str, font: pygame.font.Font, color: Tuple[int, int, int]) -> pygame.Surface:
+    # Keyed on the font object, so glyphs are re-rendered after clear_font_cache()
+    return font.render(char, True, color)
+
+
 class Dropdown(Widget):
     """
     A dropdown / combo-box widget.
@@ -35,6 +49,14 @@ class Dropdown(Widget):
 
     _focusable = True
 
+    __slots__ = (
+        "_options", "_selected_index", "_font_size", "_text_color", "_bg_color",
+        "_hover_color", "_selected_color", "_border_color", "_border_radius",
+        "_max_visible", "_visible_count", "_open", "_hovered_option", "_scroll_offset",
+        "_on_change_cb", "_font", "_text_cache", "_list_rect_key", "_list_rect_cache",
+        "_strip_key", "_selected_strip", "_hover_strip", "_row_of_y_key", "_row_of_y",
+    )
+
     def __init__(
         self,
         x: int = 0,
@@ -65,6 +87,7 @@ class Dropdown(Widget):
         self._border_color = border_color
         self._border_radius = border_radius
         self._max_visible = max_visible
+        self._visible_count = min(len(self._options), max_visible)  # rows shown when open
 
         self._open = False
         self._hovered_option: int = -1
@@ -72,6 +95,20 @@ class Dropdown(Widget):
 
         self._on_change_cb: Optional[Callable[[int, str], None]] = None
 
+        self._font: Optional[pygame.font.Font] = None  # created on first draw
+        # Rendered text surfaces keyed by (text, color); cleared with the font
+        self._text_cache: Dict[Tuple[str, Tuple[int, int, int]], pygame.Surface] = {}
+        # Last list rect and the geometry it was computed from
+        self._list_rect_key: Optional[Tuple[int, ...]] = None
+        self._list_rect_cache: Optional[pygame.Rect] = None
+        # Solid row highlights, blitted instead of drawn per frame (see _get_strips)
+        self._strip_key: Optional[Tuple[int, int]] = None
+        self._selected_strip: Optional[pygame.Surface] = None
+        self._hover_strip: Optional[pygame.Surface] = None
+        # List row under each pixel offset into the open list (see _row_table)
+        self._row_of_y_key: Optional[Tuple[int, int]] = None
+        self._row_of_y: array = array('H')
+
     # -- Public API -----------------------------------------------------------
 
     @property
@@ -81,10 +118,23 @@ class Dropdown(Widget):
     @options.setter
     def options(self, value: List[str]) -> None:
         self._options = list(value)
+        self._visible_count = min(len(self._options), self._max_visible)
+        self._text_cache.clear()
         if self._selected_index >= len(self._options):
             self._selected_index = 0 if self._options else -1
         self._scroll_offset = 0
 
+    @property
+    def font_size(self) -> int:
+        return self._font_size
+
+    @font_size.setter
+    def font_size(self, value: int) -> None:
+        if value != self._font_size:
+            self._font_size = value
+            self._font = None
+            self._text_cache.clear()
+
     @property
     def selected_index(self) -> int:
         return self._selected_index
@@ -111,22 +161,59 @@ class Dropdown(Widget):
 
     # -- Geometry helpers -----------------------------------------------------
 
+    def _get_font(self) -> pygame.font.Font:
+        """Return the font, created once per font size instead of every frame."""
+        if self._font is None:
+            self._font = get_font(self._font_size)
+        return self._font
+
+    def _render_text(self, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Return *text* rendered in *color*, rasterized only the first time."""
+        key = (text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            surf = self._get_font().render(text, True, color)
+            self._text_cache[key] = surf
+        return surf
+
+    def _get_strips(self, width: int, height: int) -> Tuple[pygame.Surface, pygame.Surface]:
+        """Return the (selected, hovered) row highlight surfaces for a row size."""
+        if self._strip_key != (width, height):
+            self._strip_key = (width, height)
+            self._selected_strip = pygame.Surface((width, height))
+            self._selected_strip.fill(self._selected_color)
+            self._hover_strip = pygame.Surface((width, height))
+            self._hover_strip.fill(self._hover_color)
+        return self._selected_strip, self._hover_strip
+
+    def _row_table(self, height: int, visible: int) -> array:
+        """Return a table mapping a y offset inside the list to its row."""
+        if self._row_of_y_key != (height, visible):
+            self._row_of_y_key = (height, visible)
+            self._row_of_y = array('H', [y // height for y in range(height * visible)])
+        return self._row_of_y
+
     def _item_height(self) -> int:
         return self._rect.height
 
     def _list_rect(self) -> pygame.Rect:
-        """Return the absolute rect of the open option list."""
+        """Return the absolute rect of the open option list (treat as read-only)."""
         abs_x, abs_y = self.get_absolute_position()
-        ih = self._item_height()
-        visible = min(len(self._options), self._max_visible)
-        return pygame.Rect(abs_x, abs_y + self._rect.height, self._rect.width, ih * visible)
+        rect = self._rect
+        visible = self._visible_count
+        key = (abs_x, abs_y, rect.width, rect.height, visible)
+        if key != self._list_rect_key:
+            self._list_rect_key = key
+            self._list_rect_cache = pygame.Rect(
+                abs_x, abs_y + rect.height, rect.width, rect.height * visible
+            )
+        return self._list_rect_cache
 
     def _can_scroll_up(self) -> bool:
         return self._scroll_offset > 0
 
     def _can_scroll_down(self) -> bool:
-        visible = min(len(self._options), self._max_visible)
-        return self._scroll_offset + visible < len(self._options)
+        return self._scroll_offset + self._visible_count < len(self._options)
 
     # -- Event handling -------------------------------------------------------
 
@@ -144,13 +231,19 @@ class Dropdown(Widget):
         if not self.visible or not self.enabled or not self._open:
             return False
 
+        # Geometry is resolved once per event: one parent-chain walk for the
+        # list rect, and the button rect is derived from it
         lr = self._list_rect()
+        ih = self._rect.height
+        in_list = lr.collidepoint
+        # collidepoint keeps my - lr.y inside the table, so no division per motion
+        row_of_y = self._row_table(ih, self._visible_count)
 
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             mx, my = event.pos
-            if lr.collidepoint(mx, my):
+            if in_list(mx, my):
                 rel_y = my - lr.y
-                idx = self._scroll_offset + rel_y // self._item_height()
+                idx = self._scroll_offset + row_of_y[rel_y]
                 if 0 <= idx < len(self._options):
                     old = self._selected_index
                     self._selected_index = idx
@@ -163,13 +256,13 @@ class Dropdown(Widget):
                 return True  # Consume — prevent widgets behind the list from seeing this
 
             # Click outside both the list and the button → close but don't consume
-            abs_rect = self.absolute_rect
-            if not abs_rect.collidepoint(mx, my):
+            button_rect = pygame.Rect(lr.x, lr.y - ih, lr.width, ih)
+            if not button_rect.collidepoint(mx, my):
                 self._open = False
             return False
 
         if event.type == pygame.MOUSEWHEEL:
-            if lr.collidepoint(*pygame.mouse.get_pos()):
+            if in_list(*pygame.mouse.get_pos()):
                 if event.y > 0 and self._can_scroll_up():
                     self._scroll_offset -= 1
                 elif event.y < 0 and self._can_scroll_down():
@@ -178,8 +271,8 @@ class Dropdown(Widget):
 
         if event.type == pygame.MOUSEMOTION:
             mx, my = event.pos
-            if lr.collidepoint(mx, my):
-                self._hovered_option = self._scroll_offset + (my - lr.y) // self._item_height()
+            if in_list(mx, my):
+                self._hovered_option = self._scroll_offset + row_of_y[my - lr.y]
             else:
                 self._hovered_option = -1
 
@@ -274,7 +367,7 @@ class Dropdown(Widget):
         return False
 
     def _ensure_visible(self, idx: int) -> None:
-        visible = min(len(self._options), self._max_visible)
+        visible = self._visible_count
         if idx < self._scroll_offset:
             self._scroll_offset = idx
         elif idx >= self._scroll_offset + visible:
@@ -291,7 +384,6 @@ class Dropdown(Widget):
             return
 
         abs_rect = self.absolute_rect
-        font = pygame.font.Font(None, self._font_size)
 
         # Button background
         bg = self._hover_color if self._state.hovered and not self._open else self._bg_color
@@ -308,13 +400,13 @@ class Dropdown(Widget):
 
         # Selected text
         text = self.selected_text or "—"
-        txt_surf = font.render(text, True, self._text_color)
+        txt_surf = self._render_text(text, self._text_color)
         txt_rect = txt_surf.get_rect(midleft=(abs_rect.x + 8, abs_rect.centery))
         surface.blit(txt_surf, txt_rect)
 
         # Arrow indicator
         arrow = "▼" if not self._open else "▲"
-        arr_surf = font.render(arrow, True, self._text_color)
+        arr_surf = _arrow_surface(arrow, self._font_size, self._text_color)
         arr_rect = arr_surf.get_rect(midright=(abs_rect.right - 8, abs_rect.centery))
         surface.blit(arr_surf, arr_rect)
 
@@ -331,36 +423,39 @@ class Dropdown(Widget):
         if not self.visible or not self._open or not self._options:
             return
 
-        font = pygame.font.Font(None, self._font_size)
         lr = self._list_rect()
+        if not surface.get_clip().colliderect(lr):
+            return  # list is entirely off-screen / clipped out
         ih = self._item_height()
-        visible = min(len(self._options), self._max_visible)
+        visible = self._visible_count
 
         # List background + border
         pygame.draw.rect(surface, self._bg_color, lr, border_radius=self._border_radius)
         pygame.draw.rect(surface, self._border_color, lr, width=1, border_radius=self._border_radius)
 
+        # Highlight rows first (only the selected / hovered ones need a strip),
+        # then submit every text surface in a single blits() call
+        selected_strip, hover_strip = self._get_strips(lr.width, ih)
+        text_x = lr.x + 8
+        blit_seq = []
         for i in range(visible):
             idx = self._scroll_offset + i
             if idx >= len(self._options):
                 break
 
-            item_rect = pygame.Rect(lr.x, lr.y + i * ih, lr.width, ih)
-
+            item_y = lr.y + i * ih
             if idx == self._selected_index:
-                pygame.draw.rect(surface, self._selected_color, item_rect)
+                surface.blit(selected_strip, (lr.x, item_y))
             elif idx == self._hovered_option:
-                pygame.draw.rect(surface, self._hover_color, item_rect)
+                surface.blit(hover_strip, (lr.x, item_y))
 
-            opt_surf = font.render(self._options[idx], True, self._text_color)
-            opt_rect = opt_surf.get_rect(midleft=(item_rect.x + 8, item_rect.centery))
-            surface.blit(opt_surf, opt_rect)
+            opt_surf = self._render_text(self._options[idx], self._text_color)
+            blit_seq.append((opt_surf, (text_x, item_y + ih // 2 - opt_surf.get_height() // 2)))
 
         # Scroll indicators
         if self._can_scroll_up():
-            up_surf = font.render("▲", True, (180, 180, 180))
-            surface.blit(up_surf, (lr.right - 18, lr.y + 2))
+            blit_seq.append((_arrow_surface("▲", self._font_size, (180, 180, 180)), (lr.right - 18, lr.y + 2)))
         if self._can_scroll_down():
-            dn_surf = font.render("▼", True, (180, 180, 180))
-            surface.blit(dn_surf, (lr.right - 18, lr.bottom - ih + 2))
+            blit_seq.append((_arrow_surface("▼", self._font_size, (180, 180, 180)), (lr.right - 18, lr.bottom - ih + 2)))
 
+        surface.blits(blit_seq, doreturn=False)
@@ -6,6 +6,7 @@ from typing import Optional, Tuple
 
 import pygame
 
+from ..fonts import get_font
 from ..widget import Widget
 
 
@@ -33,6 +34,11 @@ class Label(Widget):
     VALIGN_CENTER = 'center'
     VALIGN_BOTTOM = 'bottom'
 
+    __slots__ = (
+        "_text", "_font_size", "_color", "_font_family", "_bold", "_italic",
+        "_align", "_valign", "_auto_size", "_rendered_text", "_needs_render",
+    )
+
     def __init__(
         self,
         x: int = 0,
@@ -129,8 +135,8 @@ class Label(Widget):
         self._update_size()
 
     def _get_font(self) -> pygame.font.Font:
-        """Get the pygame font object."""
-        return pygame.font.Font(None, self.font_size)
+        """Get the pygame font object (shared by every label with the same size and family)."""
+        return get_font(self.font_size, self._font_family, self._bold, self._italic)
 
     def _update_size(self) -> None:
         """Update widget size based on text if auto_size is enabled."""
@@ -139,6 +145,7 @@ class Label(Widget):
             text_size = font.size(self._text)
             self._rect.width = text_size[0]
             self._rect.height = text_size[1]
+            self._geometry_changed()
 
     def _render_text(self) -> None:
         """Render the text to a surface."""
@@ -190,7 +197,9 @@ class Label(Widget):
         else:  # TOP
             y = abs_y
 
-        surface.blit(self._rendered_text, (x, y))
+        # The blit is skipped when the text lies entirely outside the clip
+        if surface.get_clip().colliderect((x, y, text_width, text_height)):
+            surface.blit(self._rendered_text, (x, y))
 
         # Draw children
         self.draw_children(surface)
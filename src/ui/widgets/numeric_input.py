@@ -113,6 +113,7 @@ class NumericInput(Widget):
     @width.setter
     def width(self, value: int) -> None:
         self._rect.width = max(0, value)
+        self._geometry_changed()
         self._relayout()
 
     @property
@@ -122,6 +123,7 @@ class NumericInput(Widget):
     @height.setter
     def height(self, value: int) -> None:
         self._rect.height = max(0, value)
+        self._geometry_changed()
         self._relayout()
 
     def _relayout(self) -> None:
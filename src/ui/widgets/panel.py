@@ -29,6 +29,11 @@ class Panel(Widget):
         panel.add_child(button)
     """
 
+    __slots__ = (
+        "_bg_color", "_bg_rgb", "_border_radius", "_border_width", "_border_color",
+        "_padding", "_bg_cache", "_bg_key",
+    )
+
     def __init__(
         self,
         x: int = 0,
@@ -60,11 +65,16 @@ class Panel(Widget):
         super().__init__(x, y, width, height, parent)
 
         self._bg_color = bg_color
+        self._bg_rgb = tuple(bg_color[:3]) if bg_color else None
         self._border_radius = border_radius
         self._border_width = border_width
         self._border_color = border_color
         self._padding = padding
 
+        # Pre-baked translucent background, rebuilt when its key changes
+        self._bg_cache: Optional[pygame.Surface] = None
+        self._bg_key: Optional[tuple] = None
+
     @property
     def bg_color(self) -> Optional[Tuple]:
         """Get the background color."""
@@ -74,6 +84,9 @@ class Panel(Widget):
     def bg_color(self, value: Optional[Tuple]) -> None:
         """Set the background color."""
         self._bg_color = value
+        self._bg_rgb = tuple(value[:3]) if value else None
+        self._bg_cache = None
+        self._bg_key = None
 
     @property
     def padding(self) -> int:
@@ -110,6 +123,29 @@ class Panel(Widget):
             self._rect.height - (self._padding * 2)
         )
 
+    def _bake_background(
+        self,
+        width: int,
+        height: int,
+        bg: Optional[Tuple],
+        border_color: Optional[Tuple]
+    ) -> pygame.Surface:
+        """Render the background and border into a new per-pixel alpha surface."""
+        baked = pygame.Surface((width, height), pygame.SRCALPHA)
+        local_rect = pygame.Rect(0, 0, width, height)
+        if bg:
+            pygame.draw.rect(baked, bg, local_rect, border_radius=self._border_radius)
+        if border_color:
+            # Opaque, as when the border was drawn straight onto the target
+            pygame.draw.rect(
+                baked,
+                tuple(border_color[:3]),
+                local_rect,
+                width=self._border_width,
+                border_radius=self._border_radius
+            )
+        return baked
+
     def draw(self, surface: pygame.Surface) -> None:
         """Draw the panel."""
         if not self.visible:
@@ -117,57 +153,33 @@ class Panel(Widget):
 
         abs_rect = self.absolute_rect
 
-        # Draw background
+        # Clipped out: skip the background and border, but children may
+        # overflow the panel into view, so they are still drawn
+        if not surface.get_clip().colliderect(abs_rect):
+            self.draw_children(surface)
+            return
+
         bg = self.bg_color
-        if bg:
-            # Check if we need alpha blending
-            if len(bg) == 4 and bg[3] < 255:
-                # Create a temporary surface with per-pixel alpha
-                temp_surface = pygame.Surface(
-                    (abs_rect.width, abs_rect.height),
-                    pygame.SRCALPHA
-                )
-                if self._border_radius > 0:
-                    pygame.draw.rect(
-                        temp_surface,
-                        bg,
-                        pygame.Rect(0, 0, abs_rect.width, abs_rect.height),
-                        border_radius=self._border_radius
-                    )
-                else:
-                    temp_surface.fill(bg)
-                surface.blit(temp_surface, (abs_rect.x, abs_rect.y))
-            else:
-                # Solid color
-                if self._border_radius > 0:
-                    pygame.draw.rect(
-                        surface,
-                        bg[:3],  # RGB only
-                        abs_rect,
-                        border_radius=self._border_radius
-                    )
-                else:
-                    pygame.draw.rect(surface, bg[:3], abs_rect)
-
-        # Draw border
-        if self._border_width > 0:
-            border_color = self._border_color or (80, 80, 80)
-
-            if self._border_radius > 0:
-                pygame.draw.rect(
-                    surface,
-                    border_color,
-                    abs_rect,
-                    width=self._border_width,
-                    border_radius=self._border_radius
-                )
-            else:
-                pygame.draw.rect(
-                    surface,
-                    border_color,
-                    abs_rect,
-                    width=self._border_width
+        radius = self._border_radius
+        border_width = self._border_width
+        border_color = (self._border_color or (80, 80, 80)) if border_width > 0 else None
+
+        if (bg and len(bg) == 4 and bg[3] < 255) or (radius > 0 and (bg or border_color)):
+            # Translucent or rounded: background and border are baked into one
+            # per-pixel alpha surface, re-rasterized only when its key changes
+            key = (abs_rect.width, abs_rect.height, bg, border_color, radius, border_width)
+            if key != self._bg_key:
+                self._bg_cache = self._bake_background(
+                    abs_rect.width, abs_rect.height, bg, border_color
                 )
+                self._bg_key = key
+            surface.blit(self._bg_cache, (abs_rect.x, abs_rect.y))
+        else:
+            # Square and opaque: direct fills are cheaper than a blit
+            if bg:
+                pygame.draw.rect(surface, self._bg_rgb, abs_rect)
+            if border_color:
+                pygame.draw.rect(surface, border_color, abs_rect, width=border_width)
 
         # Draw children
         self.draw_children(surface)
@@ -23,6 +23,7 @@ from typing import Callable, List, Optional, Tuple
 
 import pygame
 
+from ..fonts import get_font
 from ..widget import Widget
 from ..containers.scroll_view import ScrollView
 from ..containers.vbox import VBox
@@ -118,7 +119,7 @@ class _ListRow(Widget):
 
     def _get_font(self) -> pygame.font.Font:
         if self._font is None:
-            self._font = pygame.font.Font(None, self._font_size)
+            self._font = get_font(self._font_size)
         return self._font
 
     # ------------------------------------------------------------------
@@ -289,7 +290,7 @@ class SelectableList(Widget):
         )
         # VBox inside the scroll view – auto-sized, no spacing between rows
         self._vbox = VBox(
-            width=width - 12,   # leave room for scrollbar
+            width=self._scroll_view.layout_width,   # leave room for scrollbar
             spacing=2,
             align=VBox.ALIGN_LEFT,
             auto_size=True,
@@ -531,7 +532,7 @@ class SelectableList(Widget):
         # Title bar
         if self._title:
             if self._title_font is None:
-                self._title_font = pygame.font.Font(None, self._title_fsize)
+                self._title_font = get_font(self._title_fsize)
             txt = self._title_font.render(self._title, True, self._title_color)
             tx = ar.x + 10
             ty = ar.y + (self._title_h - txt.get_height()) // 2
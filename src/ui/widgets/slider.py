@@ -6,6 +6,7 @@ from typing import Optional, Tuple, Callable
 
 import pygame
 
+from ..fonts import get_font
 from ..widget import Widget
 
 
@@ -52,6 +53,8 @@ class Slider(Widget):
         handle_size: int = 16,
         track_height: int = 6,
         show_value: bool = False,
+        throttle_ms: int = 0,
+        smoothing: float = 0.0,
         parent: Optional[Widget] = None,
     ):
         """
@@ -73,6 +76,10 @@ class Slider(Widget):
             handle_size: Size of the handle in pixels.
             track_height: Thickness of the track.
             show_value: Whether to show the current value.
+            throttle_ms: Minimum interval between change callbacks while
+                dragging (0 = call on every value change).
+            smoothing: Drag smoothing gain; larger follows fast drags more
+                closely (0 = no smoothing, the handle tracks the cursor).
             parent: Parent widget.
         """
         super().__init__(x, y, width, height, parent)
@@ -81,6 +88,7 @@ class Slider(Widget):
         self._max_value = max_value
         self._value = max(min_value, min(max_value, value))
         self._step = step
+        self._value_fmt = self._make_value_fmt(step)
         self._orientation = orientation
         self._track_color = track_color
         self._fill_color = fill_color
@@ -89,11 +97,23 @@ class Slider(Widget):
         self._track_height = track_height
         self._show_value = show_value
 
+        # Last value text drawn and its rendered surface
+        self._value_text: Optional[str] = None
+        self._value_surface: Optional[pygame.Surface] = None
+
         # Dragging state
         self._dragging = False
+        self._smoothing = smoothing
+        self._smoothed: Optional[float] = None  # filtered drag value
 
-        # Change callback
+        # Change callbacks
         self._on_change: Optional[Callable[[Slider], None]] = None
+        self._on_change_committed: Optional[Callable[[Slider], None]] = None
+
+        # Drag throttling: last value reported to on_change and when
+        self._throttle_ms = throttle_ms
+        self._emitted_value = self._value
+        self._last_emit: Optional[int] = None
 
     @property
     def value(self) -> float:
@@ -112,8 +132,20 @@ class Slider(Widget):
 
         if self._value != val:
             self._value = val
-            if self._on_change:
-                self._on_change(self)
+            self._emit_change()
+
+    def _emit_change(self, force: bool = False) -> None:
+        """Call on_change, at most once per throttle interval while dragging."""
+        if not self._on_change:
+            return
+        now = pygame.time.get_ticks()
+        if (not force and self._dragging and self._throttle_ms > 0
+                and self._last_emit is not None
+                and now - self._last_emit < self._throttle_ms):
+            return  # Reported on a later move or on release
+        self._last_emit = now
+        self._emitted_value = self._value
+        self._on_change(self)
 
     @property
     def min_value(self) -> float:
@@ -137,6 +169,26 @@ class Slider(Widget):
         self._max_value = val
         self.value = self._value  # Re-clamp
 
+    @property
+    def step(self) -> float:
+        """Get the value step increment."""
+        return self._step
+
+    @step.setter
+    def step(self, val: float) -> None:
+        """Set the value step increment."""
+        self._step = val
+        self._value_fmt = self._make_value_fmt(val)
+        self.value = self._value  # Re-quantize
+
+    @staticmethod
+    def _make_value_fmt(step: float) -> str:
+        """Return the format string for the value text at a given step."""
+        if step >= 1:
+            return "{:d}"
+        decimals = len(str(step).split('.')[-1])
+        return "{:.%df}" % decimals
+
     @property
     def normalized_value(self) -> float:
         """Get the value normalized to 0.0-1.0 range."""
@@ -158,6 +210,62 @@ class Slider(Widget):
         self._on_change = callback
         return self
 
+    def on_change_committed(self, callback: Callable[['Slider'], None]) -> 'Slider':
+        """
+        Set the callback called once when a drag ends.
+
+        Args:
+            callback: Function to call with the final value on mouse release.
+
+        Returns:
+            Self for method chaining.
+        """
+        self._on_change_committed = callback
+        return self
+
+    def throttled(self, ms: int) -> 'Slider':
+        """
+        Limit on_change calls while dragging to one every ``ms`` milliseconds.
+
+        Args:
+            ms: Minimum interval between calls (0 disables throttling).
+
+        Returns:
+            Self for method chaining.
+        """
+        self._throttle_ms = ms
+        return self
+
+    def smoothed(self, gain: float) -> 'Slider':
+        """
+        Smooth drag input with an adaptive moving average.
+
+        Small, slow movements are damped heavily and large, fast ones pass
+        through almost unchanged, so mouse jitter does not produce a stream
+        of sub-step value changes.
+
+        Args:
+            gain: How quickly the smoothing relaxes with drag distance
+                (0 disables smoothing).
+
+        Returns:
+            Self for method chaining.
+        """
+        self._smoothing = gain
+        return self
+
+    def _smooth_drag(self, raw: float) -> float:
+        """Blend a raw drag value into the running average and return it."""
+        prev = self._smoothed
+        if prev is None or self._smoothing <= 0:
+            self._smoothed = raw
+            return raw
+        range_val = self._max_value - self._min_value
+        jump = abs(raw - prev) / range_val if range_val else 1.0
+        alpha = min(1.0, 0.2 + jump * self._smoothing)
+        self._smoothed = alpha * raw + (1 - alpha) * prev
+        return self._smoothed
+
     def _get_handle_rect(self) -> pygame.Rect:
         """Get the handle rectangle in local coordinates."""
         abs_x, abs_y = self.get_absolute_position()
@@ -212,7 +320,8 @@ class Slider(Widget):
             if self.contains_point(event.pos[0], event.pos[1]):
                 self._dragging = True
                 self._state.pressed = True
-                self.value = self._position_to_value(event.pos[0], event.pos[1])
+                self._smoothed = None  # a click jumps straight to the cursor
+                self.value = self._smooth_drag(self._position_to_value(event.pos[0], event.pos[1]))
                 self.focus()
                 return True
 
@@ -220,6 +329,15 @@ class Slider(Widget):
             if self._dragging:
                 self._dragging = False
                 self._state.pressed = False
+                if self._smoothing > 0:
+                    # Settle on the release point rather than the lagging average
+                    self.value = self._position_to_value(event.pos[0], event.pos[1])
+                self._smoothed = None
+                # Report a value held back by the throttle
+                if self._value != self._emitted_value:
+                    self._emit_change(force=True)
+                if self._on_change_committed:
+                    self._on_change_committed(self)
                 return True
 
         elif event.type == pygame.MOUSEMOTION:
@@ -238,7 +356,7 @@ class Slider(Widget):
 
             # Handle dragging
             if self._dragging:
-                self.value = self._position_to_value(event.pos[0], event.pos[1])
+                self.value = self._smooth_drag(self._position_to_value(event.pos[0], event.pos[1]))
                 return True
 
         return False
@@ -315,17 +433,18 @@ class Slider(Widget):
 
         # Draw value text if enabled
         if self._show_value:
-            font = pygame.font.Font(None, 14)
             text_color = (255, 255, 255)
 
             # Format value
             if self._step >= 1:
-                text = str(int(self._value))
+                text = self._value_fmt.format(int(self._value))
             else:
-                decimals = len(str(self._step).split('.')[-1])
-                text = f"{self._value:.{decimals}f}"
+                text = self._value_fmt.format(self._value)
 
-            text_surface = font.render(text, True, text_color)
+            if text != self._value_text:
+                self._value_text = text
+                self._value_surface = get_font(14).render(text, True, text_color)
+            text_surface = self._value_surface
             text_rect = text_surface.get_rect()
 
             # Position above/beside handle
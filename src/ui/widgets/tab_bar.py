@@ -4,10 +4,11 @@ TabBar widget – a horizontal row of tab buttons with an active-tab indicator.
 
 from __future__ import annotations
 
-from typing import Callable, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 import pygame
 
+from ..fonts import get_font
 from ..widget import Widget
 
 
@@ -62,6 +63,11 @@ class TabBar(Widget):
         self._active_line  = active_line_color or self._ACTIVE_LINE
         self._hovered_index: int = -1
         self._on_change: Optional[Callable[[int], None]] = None
+        # Rendered labels keyed by (label, color); at most two per tab
+        self._label_cache: Dict[Tuple[str, Tuple[int, int, int]], pygame.Surface] = {}
+        # Last tab rects and the geometry they were computed from
+        self._rects_cache: List[pygame.Rect] = []
+        self._rects_cache_key: Tuple[int, ...] = ()
 
     # ── Properties ──────────────────────────────────────────────────────────
 
@@ -95,28 +101,52 @@ class TabBar(Widget):
 
     # ── Internal helpers ─────────────────────────────────────────────────────
 
-    def _tab_rects(self):
-        """Return list of (screen_rect, index) for each tab."""
+    def _get_font(self) -> pygame.font.Font:
+        return get_font(self._font_size)
+
+    def _get_label_surface(self, label: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        key = (label, color)
+        surf = self._label_cache.get(key)
+        if surf is None:
+            surf = self._get_font().render(label, True, color)
+            self._label_cache[key] = surf
+        return surf
+
+    def _tab_rects(self) -> List[pygame.Rect]:
+        """Return the screen rect of each tab (shared list, treat as read-only)."""
         n = len(self._tabs)
         if n == 0:
             return []
         ax, ay = self.get_absolute_position()
         w = self._rect.width
         h = self._rect.height
+        key = (ax, ay, w, h, n)
+        if key == self._rects_cache_key:
+            return self._rects_cache
         base_w = w // n
         rects = []
         for i in range(n):
             # Distribute rounding remainder to last tab
             tab_w = base_w if i < n - 1 else w - base_w * (n - 1)
             rects.append(pygame.Rect(ax + i * base_w, ay, tab_w, h))
+        self._rects_cache = rects
+        self._rects_cache_key = key
         return rects
 
     def _index_at(self, mx: int, my: int) -> int:
         """Return the tab index under pixel (mx, my), or -1."""
-        for i, rect in enumerate(self._tab_rects()):
-            if rect.collidepoint(mx, my):
-                return i
-        return -1
+        n = len(self._tabs)
+        if n == 0:
+            return -1
+        ax, ay = self.get_absolute_position()
+        w = self._rect.width
+        if not (ax <= mx < ax + w and ay <= my < ay + self._rect.height):
+            return -1
+        # Tabs are base_w wide; the last one also takes the rounding remainder
+        base_w = w // n
+        if base_w == 0:
+            return n - 1
+        return min((mx - ax) // base_w, n - 1)
 
     # ── Event handling ───────────────────────────────────────────────────────
 
@@ -142,7 +172,6 @@ class TabBar(Widget):
         if not self.visible:
             return
 
-        font = pygame.font.Font(None, self._font_size)
         rects = self._tab_rects()
         ind_h = self._INDICATOR_H
 
@@ -173,7 +202,7 @@ class TabBar(Widget):
 
             # Label
             color = self._TEXT_ACTIVE if is_active else self._TEXT_INACTIVE
-            text_surf = font.render(label, True, color)
+            text_surf = self._get_label_surface(label, color)
             text_rect = text_surf.get_rect(center=rect.center)
             if is_active:
                 text_rect.centery -= ind_h // 2  # shift up slightly for indicator
@@ -8,6 +8,7 @@ from typing import Optional, Tuple, Callable
 
 import pygame
 
+from ..fonts import get_font
 from ..widget import Widget
 
 _PLATFORM = platform.system()
@@ -224,8 +225,7 @@ class TextInput(Widget):
     # -------------------------------------------------------------------------
 
     def _get_font(self) -> pygame.font.Font:
-        size = self._font_size or 16
-        return pygame.font.Font(None, size)
+        return get_font(self._font_size or 16)
 
     def _update_scroll(self) -> None:
         """Keep cursor visible inside the content area."""
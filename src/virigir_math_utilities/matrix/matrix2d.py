@@ -616,7 +616,8 @@ class Matrix2D:
 
         result = cls.__new__(cls)
         result._shape = shape
-        result._data = noise_data.astype(np.float64)
+        # generate_region already yields float64; avoid a second full-grid copy
+        result._data = np.asarray(noise_data, dtype=np.float64)
         result._mask = np.ones(shape, dtype=np.bool_)
         return result
 
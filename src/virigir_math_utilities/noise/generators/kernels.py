@@ -616,7 +616,7 @@ def _fractal_noise(seed0, x, y, noise_type, fractal_type,
 # Parallel batch function
 # ============================================================================
 
-@njit(parallel=True, fastmath=True, cache=True)
+@njit(parallel=True, fastmath=True, cache=True, nogil=True)
 def noise2d_batch(
     x: NDArray[np.float64],
     y: NDArray[np.float64],
@@ -756,7 +756,7 @@ def _domain_warp_basic_grid_single(seed, x, y, warp_amp, frequency):
     return _lerp(lx0x, lx1x, ys) * warp_amp, _lerp(ly0x, ly1x, ys) * warp_amp
 
 
-@njit(parallel=True, fastmath=True, cache=True)
+@njit(parallel=True, fastmath=True, cache=True, nogil=True)
 def domain_warp_2d_batch(
     x: NDArray[np.float64],
     y: NDArray[np.float64],
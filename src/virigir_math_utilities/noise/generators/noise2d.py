@@ -456,11 +456,12 @@ class NoiseGenerator2D(NoiseGenerator):
         # Apply domain warp if enabled
         if self._domain_warp.enabled:
             warped_x, warped_y = self._domain_warp.warp_coordinates(xx, yy)
-            x_flat = warped_x.ravel().astype(np.float64)
-            y_flat = warped_y.ravel().astype(np.float64)
+            x_flat = np.asarray(warped_x.ravel(), dtype=np.float64)
+            y_flat = np.asarray(warped_y.ravel(), dtype=np.float64)
         else:
-            x_flat = xx.ravel().astype(np.float64)
-            y_flat = yy.ravel().astype(np.float64)
+            # meshgrid of float64 linspaces: ravel() is already a contiguous view
+            x_flat = xx.ravel()
+            y_flat = yy.ravel()
 
         # Generate noise using the underlying generator's vectorized method if available
         if hasattr(self._generator, 'get_values_vectorized'):
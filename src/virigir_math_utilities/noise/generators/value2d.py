@@ -178,6 +178,15 @@ class ValueNoise2D(NoiseGenerator):
         result = self._generate_noise(x, y)
         return np.float64(result[0])
 
+    def get_values_vectorized(
+        self,
+        x: NDArray[np.float64],
+        y: NDArray[np.float64]
+    ) -> NDArray[np.float64]:
+        x = (x + self._offset[0]).astype(np.float64) * self._frequency
+        y = (y + self._offset[1]).astype(np.float64) * self._frequency
+        return self._generate_noise(x.ravel(), y.ravel())
+
     def _generate_noise(
         self,
         x: NDArray[np.float64],
@@ -207,6 +207,27 @@ class ValueCubicNoise2D(NoiseGenerator):
         result = self._generate_noise(x, y)
         return np.float64(result[0])
 
+    def get_values_vectorized(
+        self,
+        x: NDArray[np.float64],
+        y: NDArray[np.float64]
+    ) -> NDArray[np.float64]:
+        """
+        Vectorized noise computation for arrays of coordinates.
+
+        Args:
+            x: Array of X coordinates.
+            y: Array of Y coordinates.
+
+        Returns:
+            Array of noise values normalized to [0, 1].
+        """
+        # Apply offset and frequency
+        x = (x + self._offset[0]).astype(np.float64) * self._frequency
+        y = (y + self._offset[1]).astype(np.float64) * self._frequency
+
+        return self._generate_noise(x.ravel(), y.ravel())
+
     def _generate_noise(
         self,
         x: NDArray[np.float64],